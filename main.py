@@ -154,6 +154,11 @@ def main():
         if not admin:
             logger.warning("Running without administrative privileges. Some operations may fail.")
     
+    # Multisampled default surface for the OpenGL-accelerated charts
+    surface_format = QtGui.QSurfaceFormat()
+    surface_format.setSamples(4)
+    QtGui.QSurfaceFormat.setDefaultFormat(surface_format)
+    
     # Create Qt application
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("NSSM GUI")
@@ -3,6 +3,11 @@ from typing import Optional, List, Dict
 import re
 import os
 
+# Characters allowed in a service name
+_SVC_NAME_RE = re.compile(r'[A-Za-z0-9_\-.]+')
+# Built-in accounts a service can run as
+_VALID_ACCOUNTS = frozenset({'LocalSystem', 'LocalService', 'NetworkService'})
+
 class ServiceConfig(BaseModel):
     """
     Pydantic model representing NSSM service configuration.
@@ -48,7 +53,7 @@ class ServiceConfig(BaseModel):
         if not v:
             return v  # Allow empty string for default constructor
         # Service names must not contain illegal characters
-        if not re.match(r'^[A-Za-z0-9_\-\.]+$', v):
+        if not _SVC_NAME_RE.fullmatch(v):
             raise ValueError("Service name contains illegal characters.")
         return v
 
@@ -107,17 +112,15 @@ class ServiceConfig(BaseModel):
 
     @field_validator('object_name')
     def validate_object_name(cls, v):
-        valid_accounts = ['LocalSystem', 'LocalService', 'NetworkService']
-        if v in valid_accounts:
+        if v in _VALID_ACCOUNTS:
             return v
         # Validate domain accounts
-        if '\\' in v:
-            domain, user = v.split('\\', 1)
-            if not domain or not user:
-                raise ValueError("Invalid object name format. Expected 'DOMAIN\\UserName'.")
-            return v
-        else:
+        domain, sep, user = v.partition('\\')
+        if not sep:
             raise ValueError(f"Invalid object name '{v}'. Use 'LocalSystem', 'LocalService', 'NetworkService', or 'DOMAIN\\UserName'.")
+        if not domain or not user:
+            raise ValueError("Invalid object name format. Expected 'DOMAIN\\UserName'.")
+        return v
 
 class ServiceInfo(BaseModel):
     """
@@ -1,24 +1,229 @@
 import os
+import sys
 import subprocess
 import json
 import logging
 from typing import List, Dict, Optional, Union, Tuple
 import asyncio
-import shlex
-from concurrent.futures import ThreadPoolExecutor
+import re
+import tempfile
 
 from .models import ServiceConfig, ServiceInfo
 
-# Create a thread pool for running commands asynchronously
-executor = ThreadPoolExecutor(max_workers=4)
+# orjson parses bytes directly and is considerably faster; it is optional
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# NSSM writes boolean settings as 0/1
+_ONE = '1'
+
+# Marks the end of each script's output on the persistent PowerShell session
+_PS_SENTINEL = b'---NSSM-GUI-END---'
+# Precedes the error text of a failed script, ahead of the sentinel
+_PS_ERROR = b'---NSSM-GUI-ERROR---'
+# Stream buffer limit for the session; the service list easily exceeds 64 KiB
+_PS_STREAM_LIMIT = 16 * 1024 * 1024
+# Seconds to wait for a script before the session is considered hung
+_PS_TIMEOUT = 60
+
+# Characters a batch file line cannot carry inside double quotes
+_CMD_UNSAFE = frozenset('"\r\n')
+# Characters that make cmd.exe require an argument to be quoted
+_CMD_SPECIAL = frozenset(' \t&|<>^(),;=!')
+
+def _quote_cmd_arg(arg: str) -> Optional[str]:
+    """Quote an argument for a batch file line, or None if it cannot be."""
+    if not arg.isascii() or any(c in _CMD_UNSAFE for c in arg):
+        return None
+    # Batch files expand %VAR% even inside quotes
+    arg = arg.replace('%', '%%')
+    if arg and not any(c in _CMD_SPECIAL for c in arg):
+        return arg
+    # Backslashes before the closing quote are doubled for the CRT parser
+    trailing = len(arg) - len(arg.rstrip('\\'))
+    return '"' + arg + '\\' * trailing + '"'
+
+def _decode_output(data: bytes) -> str:
+    """Decode process output as UTF-8, falling back to the system encoding."""
+    try:
+        return data.decode('utf-8', errors='replace')
+    except UnicodeDecodeError:
+        import locale
+        return data.decode(locale.getpreferredencoding(), errors='replace')
+
+# Default amount of a log file returned by get_service_logs
+_LOG_TAIL_BYTES = 256 * 1024
+
+def seek_log_tail(f, max_bytes: Optional[int]):
+    """Move a binary log file to the first full line of its last max_bytes."""
+    if max_bytes is None:
+        return
+    size = os.fstat(f.fileno()).st_size
+    if size > max_bytes:
+        f.seek(size - max_bytes - 1)
+        # Drop the first line unless the cut falls right after a newline
+        if f.read(1) != b'\n':
+            f.readline()
+
+def _read_log_tail(path: str, max_bytes: Optional[int]) -> str:
+    """Read at most the last max_bytes of a log file, starting on a full line."""
+    with open(path, 'rb') as f:
+        seek_log_tail(f, max_bytes)
+        data = f.read()
+    return data.decode('utf-8', errors='replace')
+
+# Splits a dump line into bare or double-quoted tokens
+_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# The STATE line of `sc query` output, e.g. "STATE : 4  RUNNING"
+_STATE_RE = re.compile(r'STATE\s*:\s*\d+\s+([A-Za-z_]+)')
+
+def _maybe_int(value: str) -> Optional[int]:
+    """Convert a decimal string to int, returning None instead of raising."""
+    value = value.strip()
+    digits = value[1:] if value[:1] == '-' else value
+    return int(value) if digits.isdecimal() else None
 
 class NSSmManager:
     """
     Class for managing NSSM services.
     """
+    # Scalar NSSM settings, keyed by setting name
+    _STR_FIELDS = {
+        'AppParameters': ('arguments', lambda v: v.strip('"')),
+        'AppDirectory': ('app_directory', lambda v: v.strip('"')),
+        'AppExit': ('app_exit', lambda v: sys.intern(v.strip('"').removeprefix('Default ').strip())),
+        'DisplayName': ('display_name', lambda v: v.strip('"')),
+        'Description': ('description', lambda v: v.strip('"')),
+        'ObjectName': ('object_name', lambda v: v.strip('"')),
+        'Start': ('start', lambda v: sys.intern(v.strip())),
+        'Type': ('type', lambda v: sys.intern(v.strip())),
+        'AppPriority': ('process_priority', lambda v: sys.intern(v.strip())),
+        'AppStdout': ('stdout_path', lambda v: v.strip('"')),
+        'AppStderr': ('stderr_path', lambda v: v.strip('"')),
+    }
+    _INT_FIELDS = {
+        'KillConsoleDelay': 'kill_console_delay',
+        'KillWindowDelay': 'kill_window_delay',
+        'KillThreadsDelay': 'kill_threads_delay',
+        'ThrottleDelay': 'throttle_delay',
+        'RestartDelay': 'restart_delay',
+        'RotateSeconds': 'rotate_seconds',
+        'RotateBytesLow': 'rotate_bytes_low',
+    }
+    _BOOL_FIELDS = {
+        'KillProcessTree': 'kill_process_tree',
+        'RotateFiles': 'rotate_files',
+        'RotateOnline': 'rotate_online',
+        'HookShareOutputHandles': 'hook_share_output_handles',
+    }
+    
+    # Settings whose ServiceConfig default matches what `nssm install` sets,
+    # mapped to their field; a new service only needs them when changed
+    _INSTALL_DEFAULTS = {
+        'AppExit': 'app_exit',
+        'ObjectName': 'object_name',
+        'Start': 'start',
+        'Type': 'type',
+        'AppPriority': 'process_priority',
+        'RestartDelay': 'restart_delay',
+        'RotateFiles': 'rotate_files',
+        'RotateOnline': 'rotate_online',
+        'RotateSeconds': 'rotate_seconds',
+        'RotateBytesLow': 'rotate_bytes_low',
+        'HookShareOutputHandles': 'hook_share_output_handles',
+    }
+    
+    # Settings that must be applied in this order: NSSM accepts an
+    # interactive service Type only for the LocalSystem account
+    _ORDERED_SETTINGS = ('ObjectName', 'Type')
+    
     def __init__(self, nssm_path: str):
         self.nssm_path = nssm_path
         self.logger = logging.getLogger("nssm_gui.service_manager")
+        # Parsed configurations keyed by service name, with the dump they
+        # were parsed from; callers get copies, so the cached models stay as parsed
+        self._config_cache: Dict[str, Tuple[str, ServiceConfig]] = {}
+        # Long-lived PowerShell process, started on first use
+        self._ps = None
+        self._ps_lock = None
+
+    async def _run_powershell(self, script: str) -> bytes:
+        """
+        Run a script in the persistent PowerShell session.
+        
+        Starting powershell.exe costs far more than the queries we run in it,
+        so a single session is kept alive and fed scripts over stdin.
+        
+        Args:
+            script: PowerShell script, on a single line
+            
+        Returns:
+            bytes: Everything the script wrote to stdout
+            
+        Raises:
+            RuntimeError: With PowerShell's error text, if the script failed
+        """
+        if self._ps_lock is None:
+            self._ps_lock = asyncio.Lock()
+            
+        async with self._ps_lock:
+            if self._ps is None or self._ps.returncode is not None:
+                self._ps = await asyncio.create_subprocess_exec(
+                    'powershell', '-NoProfile', '-NoLogo', '-NonInteractive', '-Command', '-',
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    limit=_PS_STREAM_LIMIT
+                )
+                
+            sentinel = _PS_SENTINEL.decode('ascii')
+            error_marker = _PS_ERROR.decode('ascii')
+            try:
+                # Warnings are silenced and errors made terminating and reported
+                # after the marker, keeping both off the script's own output;
+                # finally makes sure the sentinel follows even a failing script
+                command = (
+                    f"try {{ $ErrorActionPreference = 'Stop'; $WarningPreference = 'SilentlyContinue'; "
+                    f"{script} }} "
+                    f"catch {{ Write-Output ('{error_marker}' + ($_ | Out-String)) }} "
+                    f"finally {{ Write-Output '{sentinel}' }}\n"
+                )
+                self._ps.stdin.write(command.encode('utf-8'))
+                await self._ps.stdin.drain()
+                output = await asyncio.wait_for(
+                    self._ps.stdout.readuntil(_PS_SENTINEL), _PS_TIMEOUT
+                )
+            except Exception:
+                # The session is in an unknown state; start a fresh one next time
+                self._ps.kill()
+                self._ps = None
+                raise
+                
+        output, failed, error = output[:-len(_PS_SENTINEL)].partition(_PS_ERROR)
+        if failed:
+            raise RuntimeError(error.decode('utf-8', errors='replace').strip() or "Unknown Error")
+        return output
+            
+    async def close(self):
+        """Shut down the persistent PowerShell session, if one is running."""
+        if self._ps_lock is None:
+            self._ps_lock = asyncio.Lock()
+            
+        # Let a running script finish before its session goes away
+        async with self._ps_lock:
+            if self._ps is not None and self._ps.returncode is None:
+                self._ps.stdin.close()
+                await self._ps.wait()
+            self._ps = None
+            
+    def kill(self):
+        """Kill the persistent PowerShell session at once, without waiting."""
+        if self._ps is not None and self._ps.returncode is None:
+            self._ps.kill()
+        self._ps = None
 
     async def get_services(self) -> List[ServiceInfo]:
         """
@@ -28,37 +233,20 @@ class NSSmManager:
             List[ServiceInfo]: List of service information objects
         """
         try:
-            power_shell_cmd = [
-                'powershell',
-                '-NoProfile',
-                '-Command',
-                "Get-CimInstance -ClassName Win32_Service | Where-Object { $_.PathName -and ($_.PathName.Contains('nssm')) } | "
-                "Select-Object -Property Name, DisplayName, State, Status, ProcessId, PathName | ConvertTo-Json"
-            ]
-            
-            # Run the command asynchronously using the thread pool
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                # Create a new event loop if not already running
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-            result = await loop.run_in_executor(
-                executor,
-                lambda: subprocess.run(
-                    power_shell_cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
+            script = (
+                "[Console]::OutputEncoding = [Text.Encoding]::UTF8; "
+                "(Get-CimInstance -ClassName Win32_Service -Property Name, DisplayName, State, Status, ProcessId, PathName)"
+                ".Where({ $_.PathName -like '*nssm*' }) | "
+                "Select-Object -Property Name, DisplayName, State, Status, ProcessId, PathName | ConvertTo-Json -Compress -Depth 3"
             )
             
-            output = result.stdout.strip()
-            if not output:
+            output = await self._run_powershell(script)
+            
+            # Raw UTF-8 bytes go straight to the parser
+            if not output.strip():
                 return []
 
-            services_data = json.loads(output)
+            services_data = _json.loads(output)
             
             # Handle both single service and multiple services
             if isinstance(services_data, dict):
@@ -80,10 +268,9 @@ class NSSmManager:
                 
             return services
             
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else "Unknown Error"
-            self.logger.error(f"Error getting services: {error_msg}")
-            raise RuntimeError(f"Failed to get services: {error_msg}")
+        except (OSError, RuntimeError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+            self.logger.error(f"Error getting services: {str(e)}")
+            raise RuntimeError(f"Failed to get services: {str(e)}")
         except json.JSONDecodeError as e:
             self.logger.error(f"Error parsing JSON: {str(e)}")
             raise RuntimeError(f"Failed to parse service data: {str(e)}")
@@ -91,47 +278,101 @@ class NSSmManager:
             self.logger.error(f"Unexpected error: {str(e)}", exc_info=True)
             raise RuntimeError(f"Unexpected error: {str(e)}")
 
-    async def run_nssm_command(self, args: List[str]) -> str:
+    async def run_nssm_command(self, args: List[str], decode: bool = True) -> Union[str, bytes]:
         """
         Run an NSSM command asynchronously.
         
         Args:
             args: List of command arguments
+            decode: Decode the output to str; when False the raw bytes are
+                returned, for callers that ignore the output
             
         Returns:
-            str: Command output
+            Union[str, bytes]: Command output
             
         Raises:
             RuntimeError: If the command fails
         """
-        cmd = [self.nssm_path] + args
         try:
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                executor,
-                lambda: subprocess.run(cmd, capture_output=True, check=False)
+            proc = await asyncio.create_subprocess_exec(
+                self.nssm_path, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
             )
+            raw_stdout, raw_stderr = await proc.communicate()
             
-            # Try to decode output with utf-8 first, then fallback to system encoding
-            try:
-                stdout = result.stdout.decode('utf-8', errors='replace')
-                stderr = result.stderr.decode('utf-8', errors='replace')
-            except UnicodeDecodeError:
-                import locale
-                encoding = locale.getpreferredencoding()
-                stdout = result.stdout.decode(encoding, errors='replace')
-                stderr = result.stderr.decode(encoding, errors='replace')
-            
-            if result.returncode != 0:
-                error_msg = stderr if stderr else "Unknown error"
+            if proc.returncode != 0:
+                # Only decode stderr when it is needed for the message
+                error_msg = _decode_output(raw_stderr) or "Unknown error"
                 self.logger.error(f"NSSM command failed: {error_msg}")
                 raise RuntimeError(f"NSSM command failed: {error_msg}")
                 
-            return stdout
+            # Try to decode output with utf-8 first, then fallback to system encoding
+            return _decode_output(raw_stdout) if decode else raw_stdout
         except Exception as e:
             self.logger.error(f"Error running NSSM command: {str(e)}")
             raise RuntimeError(f"Error running NSSM command: {str(e)}")
             
+    async def run_nssm_batch(self, commands: List[List[str]]):
+        """
+        Run several NSSM commands in a single cmd.exe process.
+        
+        The commands are written to a temporary batch file that stops at the
+        first failing command. If any argument cannot be written safely to
+        a batch file, every command runs in its own process instead.
+        
+        Args:
+            commands: List of NSSM argument lists, run in order
+            
+        Raises:
+            RuntimeError: If a command fails
+        """
+        script = self._build_batch_script(commands)
+        if script is None:
+            await self._run_nssm_sequence(commands)
+            return
+            
+        fd, batch_path = tempfile.mkstemp(prefix='nssm-gui-', suffix='.bat')
+        try:
+            with os.fdopen(fd, 'w', encoding='ascii', newline='\r\n') as f:
+                f.write(script)
+                
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    'cmd.exe', '/d', '/c', batch_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                stdout, stderr = await proc.communicate()
+            except Exception as e:
+                self.logger.error(f"Error running NSSM command: {str(e)}")
+                raise RuntimeError(f"Error running NSSM command: {str(e)}")
+        finally:
+            try:
+                os.remove(batch_path)
+            except OSError:
+                pass
+                
+        if proc.returncode != 0:
+            error_msg = _decode_output(stderr) or _decode_output(stdout) or "Unknown error"
+            self.logger.error(f"NSSM command failed: {error_msg}")
+            raise RuntimeError(f"NSSM command failed: {error_msg}")
+                
+    def _build_batch_script(self, commands: List[List[str]]) -> Optional[str]:
+        """Write NSSM commands as batch file lines, or None if not quotable."""
+        lines = ['@echo off']
+        for args in commands:
+            quoted = [_quote_cmd_arg(arg) for arg in [self.nssm_path] + args]
+            if None in quoted:
+                return None
+            lines.append(' '.join(quoted) + ' || exit /b 1')
+        return '\n'.join(lines) + '\n'
+        
+    async def _run_nssm_sequence(self, commands: List[List[str]]):
+        """Run NSSM commands one after another, each in its own process."""
+        for args in commands:
+            await self.run_nssm_command(args, decode=False)
+            
     async def get_service_config(self, service_name: str) -> Optional[ServiceConfig]:
         """
         Get the configuration of a service.
@@ -145,6 +386,11 @@ class NSSmManager:
         try:
             output = await self.run_nssm_command(['dump', service_name])
             
+            # Reuse the previous result while the dump is unchanged
+            cached = self._config_cache.get(service_name)
+            if cached is not None and cached[0] == output:
+                return cached[1].model_copy(deep=True)
+                
             # Fallback to an empty dictionary if parsing fails
             config_data = {}
             try:
@@ -152,36 +398,33 @@ class NSSmManager:
             except Exception as parsing_error:
                 self.logger.warning(f"Error parsing service config: {parsing_error}")
             
-            # Use get method with defaults to avoid validation errors
-            safe_config_data = {
-                'service_name': service_name,
-                'application_path': config_data.get('application_path', ''),
-                'arguments': config_data.get('arguments', ''),
-                'app_directory': config_data.get('app_directory', ''),
-                'display_name': config_data.get('display_name', ''),
-                'description': config_data.get('description', ''),
-                'start': config_data.get('start', 'SERVICE_AUTO_START')
-            }
-            
-            return ServiceConfig(**safe_config_data)
+            config_data['service_name'] = service_name
+            
+            # The dump describes an installed service, so it is trusted as is;
+            # validation (and its filesystem checks) is left to user edits
+            config = ServiceConfig.model_construct(**config_data)
+            self._config_cache[service_name] = (output, config)
+            return config.model_copy(deep=True)
         except Exception as e:
             self.logger.error(f"Error getting service config: {str(e)}")
             return None
     
     def _parse_nssm_dump(self, dump_output: str) -> dict:
         """Parse NSSM dump output into a dictionary."""
-        import shlex
         config = {}
-        lines = dump_output.strip().split('\n')
-        for line in lines:
-            if not line.strip():
+        # Collection settings accumulate here and are stored once at the end
+        dependencies = []
+        env_variables = {}
+        hooks = {}
+        for line in dump_output.splitlines():
+            if not line:
                 continue
                 
             try:
-                lexer = shlex.shlex(line, posix=False)
-                lexer.whitespace_split = True
-                lexer.commenters = ''
-                parts = list(lexer)
+                parts = [
+                    m.group(1) if m.group(1) is not None else m.group(2)
+                    for m in _TOKEN_RE.finditer(line)
+                ]
                 
                 if len(parts) >= 4:
                     command = parts[1]
@@ -198,89 +441,42 @@ class NSSmManager:
                         setting = parts[3]
                         value = ' '.join(parts[4:])
                         
-                        # Map settings to config fields
-                        self._map_setting_to_config(config, setting, value)
+                        if setting == 'DependOnService':
+                            dependencies.append(value.strip('"'))
+                        elif setting == 'AppEnvironmentExtra':
+                            key, sep, val = value.strip('"').partition('=')
+                            if sep:
+                                env_variables[key] = val
+                        elif setting.startswith('Hook_'):
+                            hooks[setting[len('Hook_'):]] = value.strip('"')
+                        else:
+                            # Map settings to config fields
+                            self._map_setting_to_config(config, setting, value)
             except Exception as e:
                 self.logger.warning(f"Error parsing line '{line}': {str(e)}")
                 continue
                 
+        if dependencies:
+            config['dependencies'] = dependencies
+        if env_variables:
+            config['env_variables'] = env_variables
+        if hooks:
+            config['hooks'] = hooks
+            
         return config
         
     def _map_setting_to_config(self, config: dict, setting: str, value: str):
         """Map NSSM settings to ServiceConfig fields."""
         # This is a helper method for _parse_nssm_dump
-        setting_mapping = {
-            'AppParameters': ('arguments', lambda v: v.strip('"')),
-            'AppDirectory': ('app_directory', lambda v: v.strip('"')),
-            'AppExit': ('app_exit', lambda v: v.strip('"').lstrip('Default ')),
-            'DisplayName': ('display_name', lambda v: v.strip('"')),
-            'Description': ('description', lambda v: v.strip('"')),
-            'ObjectName': ('object_name', lambda v: v.strip('"')),
-            'Start': ('start', lambda v: v.strip()),
-            'Type': ('type', lambda v: v.strip()),
-            'AppPriority': ('process_priority', lambda v: v.strip()),
-            'AppStdout': ('stdout_path', lambda v: v.strip('"')),
-            'AppStderr': ('stderr_path', lambda v: v.strip('"')),
-        }
-        
-        # Handle special cases
-        if setting in setting_mapping:
-            field_name, transform_func = setting_mapping[setting]
+        if setting in self._STR_FIELDS:
+            field_name, transform_func = self._STR_FIELDS[setting]
             config[field_name] = transform_func(value)
-        elif setting == 'DependOnService':
-            dep = value.strip('"')
-            config.setdefault('dependencies', []).append(dep)
-        elif setting == 'AppEnvironmentExtra':
-            env_var = value.strip('"')
-            if '=' in env_var:
-                key, val = env_var.split('=', 1)
-                config.setdefault('env_variables', {})[key] = val
-        elif setting == 'KillConsoleDelay':
-            try:
-                config['kill_console_delay'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'KillWindowDelay':
-            try:
-                config['kill_window_delay'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'KillThreadsDelay':
-            try:
-                config['kill_threads_delay'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'KillProcessTree':
-            config['kill_process_tree'] = value.strip() == '1'
-        elif setting == 'ThrottleDelay':
-            try:
-                config['throttle_delay'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'RestartDelay':
-            try:
-                config['restart_delay'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'RotateFiles':
-            config['rotate_files'] = value.strip() == '1'
-        elif setting == 'RotateOnline':
-            config['rotate_online'] = value.strip() == '1'
-        elif setting == 'RotateSeconds':
-            try:
-                config['rotate_seconds'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'RotateBytesLow':
-            try:
-                config['rotate_bytes_low'] = int(value)
-            except ValueError:
-                pass
-        elif setting == 'HookShareOutputHandles':
-            config['hook_share_output_handles'] = value.strip() == '1'
-        elif setting.startswith('Hook_'):
-            hook_event = setting[len('Hook_'):]
-            config.setdefault('hooks', {})[hook_event] = value.strip('"')
+        elif setting in self._INT_FIELDS:
+            number = _maybe_int(value)
+            if number is not None:
+                config[self._INT_FIELDS[setting]] = number
+        elif setting in self._BOOL_FIELDS:
+            config[self._BOOL_FIELDS[setting]] = value.strip() == _ONE
     
     async def configure_service(self, config: ServiceConfig, edit: bool = False) -> bool:
         """
@@ -294,32 +490,58 @@ class NSSmManager:
             bool: Whether the operation was successful
         """
         service_name = config.service_name
+        self._config_cache.pop(service_name, None)
         
         try:
+            setup_commands = []
+            
             # Install service if it's a new service
             if not edit:
-                await self.run_nssm_command(['install', service_name, config.application_path])
+                setup_commands.append(['install', service_name, config.application_path])
             elif config.application_path:
-                await self.run_nssm_command(['set', service_name, 'Application', config.application_path])
+                setup_commands.append(['set', service_name, 'Application', config.application_path])
                 
-            # Configure each setting
-            settings_commands = self._build_config_commands(service_name, config)
-            
-            # Run all the commands
+            # Configure each setting; the commands of a nested list
+            # (dependencies, environment, hooks) must keep their order, and
+            # so must the account and the service type
+            settings_commands = self._build_config_commands(service_name, config, skip_defaults=not edit)
+            groups = []
+            ordered_group = []
             for cmd in settings_commands:
-                if isinstance(cmd[0], list):  # Handle nested command lists
-                    for subcmd in cmd:
-                        await self.run_nssm_command(subcmd)
+                if isinstance(cmd[0], list):
+                    groups.append(cmd)
+                elif cmd[2] in self._ORDERED_SETTINGS:
+                    if not ordered_group:
+                        groups.append(ordered_group)
+                    ordered_group.append(cmd)
                 else:
-                    await self.run_nssm_command(cmd)
-                    
+                    groups.append([cmd])
+            commands = setup_commands + [cmd for group in groups for cmd in group]
+            
+            if self._build_batch_script(commands) is not None:
+                # Run all the commands from one batch file
+                await self.run_nssm_batch(commands)
+            else:
+                # One process per command: install first, then apply the
+                # independent settings concurrently
+                await self._run_nssm_sequence(setup_commands)
+                await asyncio.gather(*(self._run_nssm_sequence(group) for group in groups))
             return True
         except Exception as e:
             self.logger.error(f"Error configuring service: {str(e)}")
             raise RuntimeError(f"Failed to configure service: {str(e)}")
             
-    def _build_config_commands(self, service_name: str, config: ServiceConfig) -> List[List[str]]:
-        """Build NSSM commands from the configuration."""
+    def _build_config_commands(self, service_name: str, config: ServiceConfig,
+                               skip_defaults: bool = False) -> List[List[str]]:
+        """
+        Build NSSM commands from the configuration.
+        
+        Args:
+            service_name: Name of the service
+            config: Service configuration
+            skip_defaults: Leave out settings that still have the value a
+                fresh `nssm install` gives them
+        """
         commands = []
         
         # Basic settings
@@ -385,6 +607,15 @@ class NSSmManager:
         if hook_commands:
             commands.append(hook_commands)
             
+        if skip_defaults:
+            changed = config.model_dump(exclude_defaults=True)
+            commands = [
+                cmd for cmd in commands
+                if isinstance(cmd[0], list)
+                or cmd[2] not in self._INSTALL_DEFAULTS
+                or self._INSTALL_DEFAULTS[cmd[2]] in changed
+            ]
+            
         return commands
         
     async def remove_service(self, service_name: str) -> bool:
@@ -397,6 +628,8 @@ class NSSmManager:
         Returns:
             bool: Whether the operation was successful
         """
+        self._config_cache.pop(service_name, None)
+        
         try:
             # First stop the service
             try:
@@ -444,45 +677,38 @@ class NSSmManager:
         """Get the status of a service."""
         try:
             command = ['sc', 'query', service_name]
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                executor,
-                lambda: subprocess.run(command, capture_output=True, text=True, check=False)
+            result = await asyncio.to_thread(
+                subprocess.run, command, capture_output=True, text=True, check=False
             )
             
             if result.returncode != 0:
                 return "Unknown"
                 
-            for line in result.stdout.split('\n'):
-                if 'STATE' in line:
-                    parts = line.strip().split(':')
-                    if len(parts) > 1:
-                        state_parts = parts[1].strip().split()
-                        # Extract the text representation of the state
-                        state_text = next((p for p in state_parts if p.isalpha()), "Unknown")
-                        return state_text.upper()
-            return "Unknown"
+            # Extract the text representation of the state
+            match = _STATE_RE.search(result.stdout)
+            return match.group(1).upper() if match else "Unknown"
         except Exception as e:
             self.logger.error(f"Error getting service status: {str(e)}")
             return "Error"
             
-    async def get_service_logs(self, service_name: str, log_type: str = 'stdout') -> str:
+    async def get_service_logs(self, service_name: str, log_type: str = 'stdout',
+                               max_bytes: Optional[int] = _LOG_TAIL_BYTES) -> str:
         """
         Get the service logs.
         
         Args:
             service_name: Name of the service
             log_type: 'stdout' or 'stderr'
+            max_bytes: Only return the end of the log, or None for the whole file
             
         Returns:
             str: Log content
         """
         try:
-            config = await self.get_service_config(service_name)
-            if not config:
-                return "Could not retrieve service configuration."
-                
-            log_path = config.stdout_path if log_type == 'stdout' else config.stderr_path
+            # Query just the log path rather than parsing the whole dump
+            setting = 'AppStdout' if log_type == 'stdout' else 'AppStderr'
+            output = await self.run_nssm_command(['get', service_name, setting])
+            log_path = output.strip().strip('"')
             if not log_path:
                 return f"No {log_type} log path configured."
                 
@@ -490,10 +716,7 @@ class NSSmManager:
                 return f"Log file {log_path} does not exist."
                 
             # Read the log file
-            with open(log_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                
-            return content
+            return await asyncio.to_thread(_read_log_tail, log_path, max_bytes)
         except Exception as e:
             self.logger.error(f"Error getting service logs: {str(e)}")
             return f"Error getting service logs: {str(e)}"
\ No newline at end of file
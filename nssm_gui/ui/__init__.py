@@ -1,2 +1,5 @@
 # NSSM GUI - A graphical user interface for the Non-Sucking Service Manager
 # Copyright (c) 2025
+
+# Delay after the last keystroke before a filter box is applied
+FILTER_DELAY_MS = 150
@@ -1,12 +1,61 @@
 from PyQt5 import QtWidgets, QtGui, QtCore, QtChart
 import datetime
+import heapq
 import logging
+import os
+import time
 from typing import Dict, Any, Optional, List
 
 from ..utils.monitoring import ServiceMonitor
+from . import FILTER_DELAY_MS
 
 logger = logging.getLogger("nssm_gui.dashboard")
 
+# Delay between automatic refreshes, counted from the end of the last one
+_REFRESH_INTERVAL_MS = 1000
+# Quiet time after the last resize before charts are redrawn
+_RESIZE_IDLE_MS = 200
+
+def _m4_points(timestamps_ms, values, buckets):
+    """
+    Downsample a line to at most four points per bucket (M4 aggregation).
+    
+    Each bucket keeps its first, lowest, highest and last sample, which
+    draws the same line as the full data when a bucket is one pixel wide.
+    """
+    points = []
+    size = len(values) / buckets
+    for bucket in range(buckets):
+        start = int(bucket * size)
+        end = int((bucket + 1) * size)
+        if start >= end:
+            continue
+        indexes = range(start, end)
+        lowest = min(indexes, key=values.__getitem__)
+        highest = max(indexes, key=values.__getitem__)
+        for i in sorted({start, lowest, highest, end - 1}):
+            points.append(QtCore.QPointF(timestamps_ms[i], values[i]))
+    return points
+    
+def _max_redraw_rate() -> float:
+    """
+    Highest redraw rate in Hz.
+    
+    This is the refresh rate of the primary screen, optionally capped lower
+    with NSSM_GUI_MAX_REDRAW_HZ.
+    """
+    screen = QtWidgets.QApplication.primaryScreen()
+    rate = screen.refreshRate() if screen else 0
+    if rate <= 0:
+        rate = 60.0
+    value = os.environ.get('NSSM_GUI_MAX_REDRAW_HZ', '0')
+    try:
+        configured = float(value)
+    except ValueError:
+        logger.warning(f"Ignoring NSSM_GUI_MAX_REDRAW_HZ={value!r}; it must be a number")
+        configured = 0
+    return min(rate, configured) if configured > 0 else rate
+
 class ServiceResourceWidget(QtWidgets.QGroupBox):
     """Widget for displaying service resource usage."""
     
@@ -25,7 +74,8 @@ class ServiceResourceWidget(QtWidgets.QGroupBox):
         
         # Create chart
         self.chart = QtChart.QChart()
-        self.chart.setAnimationOptions(QtChart.QChart.SeriesAnimations)
+        # Series animations do not work with OpenGL-accelerated series
+        self.chart.setAnimationOptions(QtChart.QChart.NoAnimation)
         self.chart.legend().setVisible(True)
         self.chart.legend().setAlignment(QtCore.Qt.AlignBottom)
         
@@ -33,6 +83,7 @@ class ServiceResourceWidget(QtWidgets.QGroupBox):
         self.axis_x = QtChart.QDateTimeAxis()
         self.axis_x.setFormat("hh:mm:ss")
         self.axis_x.setTitleText("Time")
+        self._axis_range_ms = (0, 0)  # Last range applied to the time axis
         
         self.axis_y = QtChart.QValueAxis()
         self.axis_y.setLabelFormat("%.1f")
@@ -68,8 +119,11 @@ class ServiceResourceWidget(QtWidgets.QGroupBox):
         # Create series
         self.series = QtChart.QLineSeries()
         self.series.setName(title)
+        # Rasterize the line on the GPU instead of the CPU
+        self.series.setUseOpenGL(True)
         
-        # Set series color
+        # Set series color; some Qt versions draw OpenGL series one pixel
+        # wide regardless of the pen width
         pen = self.series.pen()
         pen.setColor(color)
         pen.setWidth(2)
@@ -82,30 +136,40 @@ class ServiceResourceWidget(QtWidgets.QGroupBox):
         self.series.attachAxis(self.axis_x)
         self.series.attachAxis(self.axis_y)
         
-    def update_data(self, values, timestamps):
-        """Update the chart with new data."""
-        # Clear existing points
-        self.series.clear()
-        
-        # Add data points
-        for i, value in enumerate(values):
-            timestamp = timestamps[i]
-            msecs = int(timestamp.timestamp() * 1000)  # Convert to milliseconds
-            self.series.append(msecs, value)
-            
-        # Update axes ranges
-        if timestamps:
-            start_time = int(timestamps[0].timestamp() * 1000)
-            end_time = int(timestamps[-1].timestamp() * 1000)
-            self.axis_x.setRange(
-                QtCore.QDateTime.fromMSecsSinceEpoch(start_time),
-                QtCore.QDateTime.fromMSecsSinceEpoch(end_time)
-            )
+    def update_data(self, values, timestamps_ms, average=None):
+        """Update the chart with new data, timestamped in epoch milliseconds."""
+        # More points than the plot has pixels cannot be told apart, so
+        # long histories are reduced to four points per pixel column
+        pixels = int(self.chart.plotArea().width())
+        if pixels > 0 and len(values) > 4 * pixels:
+            points = _m4_points(timestamps_ms, values, pixels)
+        else:
+            points = [
+                QtCore.QPointF(timestamp, value)
+                for timestamp, value in zip(timestamps_ms, values)
+            ]
+            
+        # Replace all points in one call instead of appending them one by one
+        self.series.replace(points)
+            
+        # Update axes ranges, unless neither end moved by a whole pixel
+        if timestamps_ms:
+            start, end = timestamps_ms[0], timestamps_ms[-1]
+            last_start, last_end = self._axis_range_ms
+            pixel_ms = (end - start) / max(1, pixels)
+            if abs(start - last_start) >= pixel_ms or abs(end - last_end) >= pixel_ms:
+                self.axis_x.setRange(
+                    QtCore.QDateTime.fromMSecsSinceEpoch(start),
+                    QtCore.QDateTime.fromMSecsSinceEpoch(end)
+                )
+                self._axis_range_ms = (start, end)
             
         # Calculate stats
         if values:
             current = values[-1]
-            average = sum(values) / len(values)
+            # Reuse the average the monitor already computed when given
+            if average is None:
+                average = sum(values) / len(values)
             peak = max(values)
             
             self.current_label.setText(f"Current: {current:.1f}")
@@ -116,7 +180,72 @@ class ServiceResourceWidget(QtWidgets.QGroupBox):
             max_value = peak * 1.2  # Add 20% margin
             self.axis_y.setRange(0, max(max_value, 0.1))  # Ensure non-zero range
             
-class ServiceDashboardDialog(QtWidgets.QDialog):
+class _LiveChartDialog(QtWidgets.QDialog):
+    """
+    Base of the dialogs that redraw live monitoring charts.
+    
+    Redraws are skipped while the dialog is hidden or being resized, while
+    auto-refresh is off, and beyond the screen's refresh rate; showing the
+    dialog or finishing a resize catches up through refresh_data, which
+    subclasses implement. Subclasses also provide auto_refresh_check.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._last_redraw = 0.0
+        self._max_redraw_hz = _max_redraw_rate()
+        
+        # Charts are not redrawn while a resize is in progress
+        self._resizing = False
+        self._resize_idle = QtCore.QTimer(self)
+        self._resize_idle.setSingleShot(True)
+        self._resize_idle.timeout.connect(self._resize_finished)
+        
+    def refresh_data(self):
+        """Refresh the charts; subclasses override this, the base does nothing."""
+        
+    def _redraw_due(self) -> bool:
+        """Check whether the charts should be redrawn now."""
+        # Nothing to redraw while the dialog is hidden; showEvent catches up
+        if not self.isVisible():
+            return False
+            
+        # Wait for a resize to settle; _resize_finished catches up
+        if self._resizing:
+            return False
+            
+        # Check if auto-refresh is enabled
+        if not self.auto_refresh_check.isChecked():
+            return False
+            
+        # Never redraw faster than the screen can show
+        now = time.monotonic()
+        if now - self._last_redraw < 1.0 / self._max_redraw_hz:
+            return False
+        self._last_redraw = now
+        return True
+        
+    def resizeEvent(self, event):
+        """Hold off chart updates until resizing stops."""
+        super().resizeEvent(event)
+        self._pause_for_resize()
+        
+    def _pause_for_resize(self):
+        """Pause redraws until no resize happened for a moment."""
+        self._resizing = True
+        self._resize_idle.start(_RESIZE_IDLE_MS)
+        
+    def _resize_finished(self):
+        """Resume redraws and catch up after a resize."""
+        self._resizing = False
+        self.refresh_data()
+        
+    def showEvent(self, event):
+        """Apply the updates skipped while the dialog was hidden."""
+        super().showEvent(event)
+        self.refresh_data()
+        
+class ServiceDashboardDialog(_LiveChartDialog):
     """Dialog for monitoring service resource usage."""
     
     def __init__(self, parent=None, service_name="", pid=None, service_monitor=None):
@@ -127,6 +256,8 @@ class ServiceDashboardDialog(QtWidgets.QDialog):
         self.service_name = service_name
         self.pid = pid
         self.service_monitor = service_monitor
+        self._chart_revisions = {}  # Map of history key to the revision last drawn
+        self._last_uptime = None  # Whole seconds shown in the uptime label
         
         self.init_ui()
         self.setup_update_timer()
@@ -199,6 +330,24 @@ class ServiceDashboardDialog(QtWidgets.QDialog):
         self.tabs.addTab(self.memory_tab, "Memory")
         self.tabs.addTab(self.io_tab, "I/O")
         
+        # History key, average key and chart of each tab's charts
+        self._tab_charts = {
+            self.cpu_tab: (
+                ('cpu_history', 'cpu_avg', self.cpu_chart),
+            ),
+            self.memory_tab: (
+                ('memory_history', 'memory_avg', self.memory_percent_chart),
+                ('memory_mb_history', 'memory_mb_avg', self.memory_mb_chart),
+            ),
+            self.io_tab: (
+                ('io_read_history', None, self.io_read_chart),
+                ('io_write_history', None, self.io_write_chart),
+            ),
+        }
+        
+        # Charts on hidden tabs are not updated, so refresh on switching
+        self.tabs.currentChanged.connect(self.refresh_data)
+        
         # Bottom buttons
         button_layout = QtWidgets.QHBoxLayout()
         
@@ -224,17 +373,26 @@ class ServiceDashboardDialog(QtWidgets.QDialog):
         
     def setup_update_timer(self):
         """Set up a timer for automatic updates."""
+        # Single-shot and restarted after each refresh, so slow refreshes
+        # cannot pile up in the event queue
         self.update_timer = QtCore.QTimer(self)
-        self.update_timer.timeout.connect(self.refresh_data)
-        self.update_timer.start(1000)  # Update every second
+        self.update_timer.setSingleShot(True)
+        self.update_timer.timeout.connect(self.auto_refresh)
+        self.update_timer.start(_REFRESH_INTERVAL_MS)
         
+    def auto_refresh(self):
+        """Refresh from the timer and schedule the next refresh."""
+        try:
+            self.refresh_data()
+        finally:
+            self.update_timer.start(_REFRESH_INTERVAL_MS)
+            
     def refresh_data(self):
         """Refresh the dashboard data."""
         if not self.service_monitor:
             return
             
-        # Check if auto-refresh is enabled
-        if not self.auto_refresh_check.isChecked():
+        if not self._redraw_due():
             return
             
         # Get service stats
@@ -242,45 +400,32 @@ class ServiceDashboardDialog(QtWidgets.QDialog):
         
         # Update service info
         if stats['start_time']:
-            uptime_seconds = stats['uptime']
-            hours, remainder = divmod(uptime_seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            
-            uptime_str = f"{int(hours)}h {int(minutes)}m {int(seconds)}s"
-            self.uptime_label.setText(f"<b>Uptime:</b> {uptime_str}")
+            # Reformat only when the whole seconds change
+            uptime_seconds = int(stats['uptime'])
+            if uptime_seconds != self._last_uptime:
+                hours, remainder = divmod(uptime_seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                
+                uptime_str = f"{hours}h {minutes}m {seconds}s"
+                self.uptime_label.setText(f"<b>Uptime:</b> {uptime_str}")
+                self._last_uptime = uptime_seconds
             
         self.restart_label.setText(f"<b>Restarts:</b> {stats['restarts']}")
         
-        # Update charts
-        if stats['cpu_history'] and stats['timestamps']:
-            self.cpu_chart.update_data(
-                stats['cpu_history'],
-                stats['timestamps']
-            )
-            
-        if stats['memory_history'] and stats['timestamps']:
-            self.memory_percent_chart.update_data(
-                stats['memory_history'],
-                stats['timestamps']
-            )
-            
-        if stats['memory_mb_history'] and stats['timestamps']:
-            self.memory_mb_chart.update_data(
-                stats['memory_mb_history'],
-                stats['timestamps']
-            )
-            
-        if stats['io_read_history'] and stats['timestamps']:
-            self.io_read_chart.update_data(
-                stats['io_read_history'],
-                stats['timestamps']
-            )
-            
-        if stats['io_write_history'] and stats['timestamps']:
-            self.io_write_chart.update_data(
-                stats['io_write_history'],
-                stats['timestamps']
+        # Update only the charts on the visible tab, and only when the
+        # monitor has taken a new sample since they were last drawn
+        for key, average_key, chart in self._tab_charts.get(self.tabs.currentWidget(), ()):
+            if not stats[key] or not stats['timestamps_ms']:
+                continue
+            if self._chart_revisions.get(key) == stats['revision']:
+                continue
+                
+            chart.update_data(
+                stats[key],
+                stats['timestamps_ms'],
+                stats[average_key] if average_key else None
             )
+            self._chart_revisions[key] = stats['revision']
             
     def restart_service(self):
         """Restart the service."""
@@ -300,20 +445,62 @@ class ServiceDashboardDialog(QtWidgets.QDialog):
         self.update_timer.stop()
         event.accept()
         
-class ServiceMonitoringDialog(QtWidgets.QDialog):
+class StatsWorker(QtCore.QObject):
+    """Collects monitoring stats on a worker thread."""
+    
+    stats_ready = QtCore.pyqtSignal(dict)
+    
+    def __init__(self, service_monitor):
+        super().__init__()
+        self.service_monitor = service_monitor
+        self.timer = None
+        
+    @QtCore.pyqtSlot()
+    def start(self):
+        """Start sampling once a second; runs on the worker thread."""
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(_REFRESH_INTERVAL_MS)
+        self.sample()
+        
+    @QtCore.pyqtSlot()
+    def sample(self):
+        """Emit the stats of all monitored services."""
+        try:
+            self.stats_ready.emit(self.service_monitor.get_all_service_stats())
+        except Exception as e:
+            logger.error(f"Error collecting service stats: {str(e)}")
+            
+class ServiceMonitoringDialog(_LiveChartDialog):
     """Dialog for monitoring multiple services."""
     
+    # Status colors, shared instead of created per row update
+    _BRUSH_GREEN = QtGui.QBrush(QtGui.QColor(0, 128, 0))
+    _BRUSH_RED = QtGui.QBrush(QtGui.QColor(128, 0, 0))
+    
     def __init__(self, parent=None, services=None, service_monitor=None):
         super().__init__(parent)
         self.setWindowTitle('Service Monitoring')
         self.setGeometry(100, 100, 1000, 700)
         
-        self.services = services or []
+        self.services = services
         self.service_monitor = service_monitor
+        self._columns_sized = False
+        self._items_by_name = {}  # Map of service name to its row's model items
+        self._uptime_texts = {}  # Map of service name to (uptime seconds, text)
         
         self.init_ui()
-        self.setup_update_timer()
-        self.refresh_data()
+        self.setup_stats_worker()
+        
+    @property
+    def services(self):
+        """Services shown in the dialog."""
+        return self._services
+        
+    @services.setter
+    def services(self, services):
+        self._services = services or []
+        self._services_by_name = {service.name: service for service in self._services}
         
     def init_ui(self):
         """Initialize the UI components."""
@@ -332,18 +519,31 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         filter_label = QtWidgets.QLabel("Filter:")
         self.filter_input = QtWidgets.QLineEdit()
         self.filter_input.setPlaceholderText("Filter services...")
-        self.filter_input.textChanged.connect(self.apply_filter)
+        
+        # Refilter once typing pauses rather than on every keystroke
+        self.filter_timer = QtCore.QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(self.filter_timer.start)
         
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.filter_input)
         
-        # Services table
-        self.services_table = QtWidgets.QTableWidget()
-        self.services_table.setColumnCount(8)
-        self.services_table.setHorizontalHeaderLabels([
+        # Services table; the proxy sorts and filters it on the C++ side
+        self.services_model = QtGui.QStandardItemModel(0, 8, self)
+        self.services_model.setHorizontalHeaderLabels([
             'Service Name', 'PID', 'Status', 'CPU (%)', 'Memory (%)', 
             'Memory (MB)', 'Uptime', 'Restarts'
         ])
+        
+        self.services_proxy = QtCore.QSortFilterProxyModel(self)
+        self.services_proxy.setSourceModel(self.services_model)
+        self.services_proxy.setFilterKeyColumn(0)  # Filter on the service name column
+        self.services_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        
+        self.services_table = QtWidgets.QTableView()
+        self.services_table.setModel(self.services_proxy)
         self.services_table.horizontalHeader().setStretchLastSection(True)
         self.services_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.services_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
@@ -371,12 +571,28 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         
         self.cpu_chart_obj = QtChart.QChart()
         self.cpu_chart_obj.setTitle("CPU Usage by Service")
-        self.cpu_chart_obj.setAnimationOptions(QtChart.QChart.SeriesAnimations)
+        self.cpu_chart_obj.setAnimationOptions(QtChart.QChart.NoAnimation)
         self.cpu_chart_obj.legend().setVisible(True)
         self.cpu_chart_obj.legend().setAlignment(QtCore.Qt.AlignBottom)
         
         self.cpu_chart.setChart(self.cpu_chart_obj)
         
+        # The series and axes are created once and updated in place
+        self._cpu_bar_set = QtChart.QBarSet("CPU Usage")
+        self._cpu_bar_series = QtChart.QBarSeries()
+        self._cpu_bar_series.append(self._cpu_bar_set)
+        self.cpu_chart_obj.addSeries(self._cpu_bar_series)
+        
+        self._cpu_axis_x = QtChart.QBarCategoryAxis()
+        self._cpu_axis_y = QtChart.QValueAxis()
+        self._cpu_axis_y.setTitleText("CPU Usage (%)")
+        
+        self.cpu_chart_obj.addAxis(self._cpu_axis_x, QtCore.Qt.AlignBottom)
+        self.cpu_chart_obj.addAxis(self._cpu_axis_y, QtCore.Qt.AlignLeft)
+        
+        self._cpu_bar_series.attachAxis(self._cpu_axis_x)
+        self._cpu_bar_series.attachAxis(self._cpu_axis_y)
+        
         cpu_layout.addWidget(self.cpu_chart)
         
         # Memory chart tab
@@ -389,12 +605,15 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         
         self.memory_chart_obj = QtChart.QChart()
         self.memory_chart_obj.setTitle("Memory Usage by Service")
-        self.memory_chart_obj.setAnimationOptions(QtChart.QChart.SeriesAnimations)
+        self.memory_chart_obj.setAnimationOptions(QtChart.QChart.NoAnimation)
         self.memory_chart_obj.legend().setVisible(True)
         self.memory_chart_obj.legend().setAlignment(QtCore.Qt.AlignBottom)
         
         self.memory_chart.setChart(self.memory_chart_obj)
         
+        self._mem_pie_series = QtChart.QPieSeries()
+        self.memory_chart_obj.addSeries(self._mem_pie_series)
+        
         memory_layout.addWidget(self.memory_chart)
         
         # Add tabs
@@ -409,6 +628,7 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         
         # Set initial sizes
         self.splitter.setSizes([500, 300])
+        self.splitter.splitterMoved.connect(self._pause_for_resize)
         
         layout.addWidget(self.splitter)
         
@@ -435,24 +655,42 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         
         layout.addLayout(button_layout)
         
-    def setup_update_timer(self):
-        """Set up a timer for automatic updates."""
-        self.update_timer = QtCore.QTimer(self)
-        self.update_timer.timeout.connect(self.refresh_data)
-        self.update_timer.start(1000)  # Update every second
-        
-    def refresh_data(self):
-        """Refresh the monitoring data."""
+    def setup_stats_worker(self):
+        """Collect stats on a worker thread so sampling never blocks painting."""
+        self._stats_thread = None
         if not self.service_monitor:
             return
             
-        # Check if auto-refresh is enabled
-        if not self.auto_refresh_check.isChecked():
+        self._stats_thread = QtCore.QThread(self)
+        self._stats_worker = StatsWorker(self.service_monitor)
+        self._stats_worker.moveToThread(self._stats_thread)
+        self._stats_thread.started.connect(self._stats_worker.start)
+        self._stats_thread.finished.connect(self._stats_worker.deleteLater)
+        self._stats_worker.stats_ready.connect(self.apply_stats, QtCore.Qt.QueuedConnection)
+        self._stats_thread.start()
+        
+    def stop_stats_worker(self):
+        """Stop the stats worker thread."""
+        if self._stats_thread is not None:
+            self._stats_thread.quit()
+            self._stats_thread.wait()
+            self._stats_thread = None
+            
+    def refresh_data(self):
+        """Refresh the monitoring data."""
+        if self._stats_thread is None:
             return
             
-        # Get all service stats
-        all_stats = self.service_monitor.get_all_service_stats()
+        # Ask the worker for fresh stats; they arrive through apply_stats
+        QtCore.QMetaObject.invokeMethod(
+            self._stats_worker, "sample", QtCore.Qt.QueuedConnection
+        )
         
+    def apply_stats(self, all_stats):
+        """Show stats collected by the worker thread."""
+        if not self._redraw_due():
+            return
+            
         # Update services table
         self.update_services_table(all_stats)
         
@@ -461,80 +699,81 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         
     def update_services_table(self, all_stats):
         """Update the services table with current data."""
-        # Save current selection
-        current_row = -1
-        if self.services_table.selectionModel().hasSelection():
-            current_row = self.services_table.currentRow()
-            
-        # Clear table
-        self.services_table.setRowCount(0)
-        
-        # Add services
-        for i, service in enumerate(self.services):
-            stats = all_stats.get(service.name, {})
-            
-            self.services_table.insertRow(i)
-            
-            # Service name
-            self.services_table.setItem(i, 0, QtWidgets.QTableWidgetItem(service.name))
-            
-            # PID
-            pid_item = QtWidgets.QTableWidgetItem(str(service.pid) if service.pid else "N/A")
-            self.services_table.setItem(i, 1, pid_item)
-            
-            # Status
-            status_item = QtWidgets.QTableWidgetItem(service.state)
-            if service.state.lower() == "running":
-                status_item.setForeground(QtGui.QColor(0, 128, 0))  # Green
-            elif service.state.lower() == "stopped":
-                status_item.setForeground(QtGui.QColor(128, 0, 0))  # Red
-            self.services_table.setItem(i, 2, status_item)
-            
-            # CPU
-            cpu_current = stats.get('cpu_current', 0)
-            cpu_item = QtWidgets.QTableWidgetItem(f"{cpu_current:.1f}")
-            self.services_table.setItem(i, 3, cpu_item)
-            
-            # Memory %
-            mem_current = stats.get('memory_current', 0)
-            mem_item = QtWidgets.QTableWidgetItem(f"{mem_current:.1f}")
-            self.services_table.setItem(i, 4, mem_item)
-            
-            # Memory MB
-            mem_mb_current = stats.get('memory_mb_current', 0)
-            mem_mb_item = QtWidgets.QTableWidgetItem(f"{mem_mb_current:.1f}")
-            self.services_table.setItem(i, 5, mem_mb_item)
-            
-            # Uptime
-            uptime_seconds = stats.get('uptime', 0)
+        # Update the existing rows in place; only services that appeared
+        # or disappeared add or remove rows
+        table = self.services_table
+        model = self.services_model
+        table.setUpdatesEnabled(False)
+        self.services_proxy.setDynamicSortFilter(False)
+        try:
+            for name in [name for name in self._items_by_name if name not in self._services_by_name]:
+                model.removeRow(self._items_by_name.pop(name)[0].row())
+                self._uptime_texts.pop(name, None)
+                
+            for service in self.services:
+                stats = all_stats.get(service.name, {})
+                texts = self._row_texts(service, stats)
+                items = self._items_by_name.get(service.name)
+                
+                if items is None:
+                    # New service: add a row for it
+                    items = [QtGui.QStandardItem(text) for text in texts]
+                    self._set_status_color(items[2], service.state)
+                    model.appendRow(items)
+                    self._items_by_name[service.name] = items
+                    continue
+                    
+                for column, (item, text) in enumerate(zip(items, texts)):
+                    if item.text() != text:
+                        item.setText(text)
+                        if column == 2:
+                            self._set_status_color(item, service.state)
+        finally:
+            # Re-enabling re-sorts once for the whole refresh; the filtered
+            # name column never changes in place
+            self.services_proxy.setDynamicSortFilter(True)
+            table.setUpdatesEnabled(True)
+            
+        # Size the columns once, on the first refresh with data
+        if not self._columns_sized and model.rowCount():
+            self.services_table.resizeColumnsToContents()
+            self._columns_sized = True
+            
+    def _row_texts(self, service, stats):
+        """Get the cell texts of a service's table row."""
+        # Uptime, reformatted only when the whole seconds change
+        uptime_seconds = int(stats.get('uptime', 0))
+        cached = self._uptime_texts.get(service.name)
+        if cached is None or cached[0] != uptime_seconds:
             hours, remainder = divmod(uptime_seconds, 3600)
             minutes, seconds = divmod(remainder, 60)
-            uptime_str = f"{int(hours)}:{int(minutes):02}:{int(seconds):02}"
-            uptime_item = QtWidgets.QTableWidgetItem(uptime_str)
-            self.services_table.setItem(i, 6, uptime_item)
-            
-            # Restarts
-            restarts = stats.get('restarts', 0)
-            restart_item = QtWidgets.QTableWidgetItem(str(restarts))
-            self.services_table.setItem(i, 7, restart_item)
+            cached = (uptime_seconds, f"{hours}:{minutes:02}:{seconds:02}")
+            self._uptime_texts[service.name] = cached
+        uptime_str = cached[1]
+        
+        return [
+            service.name,
+            str(service.pid) if service.pid else "N/A",
+            service.state,
+            f"{stats.get('cpu_current', 0):.1f}",
+            f"{stats.get('memory_current', 0):.1f}",
+            f"{stats.get('memory_mb_current', 0):.1f}",
+            uptime_str,
+            str(stats.get('restarts', 0))
+        ]
+        
+    def _set_status_color(self, item, state):
+        """Color a status cell by the service state."""
+        state = state.lower()
+        if state == "running":
+            item.setForeground(self._BRUSH_GREEN)
+        elif state == "stopped":
+            item.setForeground(self._BRUSH_RED)
+        else:
+            item.setData(None, QtCore.Qt.ForegroundRole)
             
-        # Restore selection
-        if current_row >= 0 and current_row < self.services_table.rowCount():
-            self.services_table.selectRow(current_row)
-            
-        # Resize columns to content
-        self.services_table.resizeColumnsToContents()
-        
     def update_charts(self, all_stats):
         """Update the overview charts."""
-        # Clear existing charts
-        self.cpu_chart_obj.removeAllSeries()
-        self.memory_chart_obj.removeAllSeries()
-        
-        # Create series for CPU and memory charts
-        cpu_series = QtChart.QBarSeries()
-        memory_series = QtChart.QPieSeries()
-        
         # Get data for charts
         cpu_data = []
         memory_data = []
@@ -551,56 +790,50 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
                 mem_mb_current = stats.get('memory_mb_current', 0)
                 memory_data.append((service.name, mem_mb_current))
                 
-        # Sort data by usage (descending)
-        cpu_data.sort(key=lambda x: x[1], reverse=True)
-        memory_data.sort(key=lambda x: x[1], reverse=True)
-        
-        # Limit to top 10 services
-        cpu_data = cpu_data[:10]
-        memory_data = memory_data[:10]
-        
-        # Create CPU chart
-        if cpu_data:
-            cpu_bar_set = QtChart.QBarSet("CPU Usage")
-            
-            for name, value in cpu_data:
-                cpu_bar_set.append(value)
-                
-            cpu_series.append(cpu_bar_set)
-            
-            self.cpu_chart_obj.addSeries(cpu_series)
-            
-            # Create axes
-            axis_x = QtChart.QBarCategoryAxis()
-            axis_x.append([name for name, _ in cpu_data])
-            
-            axis_y = QtChart.QValueAxis()
-            axis_y.setRange(0, max([val for _, val in cpu_data]) * 1.2)  # Add 20% margin
-            axis_y.setTitleText("CPU Usage (%)")
-            
-            self.cpu_chart_obj.addAxis(axis_x, QtCore.Qt.AlignBottom)
-            self.cpu_chart_obj.addAxis(axis_y, QtCore.Qt.AlignLeft)
-            
-            cpu_series.attachAxis(axis_x)
-            cpu_series.attachAxis(axis_y)
+        # Keep the top 10 services by usage, in descending order
+        if len(cpu_data) > 10:
+            cpu_data = heapq.nlargest(10, cpu_data, key=lambda x: x[1])
+        else:
+            cpu_data.sort(key=lambda x: x[1], reverse=True)
+        if len(memory_data) > 10:
+            memory_data = heapq.nlargest(10, memory_data, key=lambda x: x[1])
+        else:
+            memory_data.sort(key=lambda x: x[1], reverse=True)
+        
+        # Update CPU chart
+        values = [value for _, value in cpu_data]
+        if self._cpu_bar_set.count() == len(values):
+            for i, value in enumerate(values):
+                self._cpu_bar_set.replace(i, value)
+        else:
+            self._cpu_bar_set.remove(0, self._cpu_bar_set.count())
+            self._cpu_bar_set.append(values)
+            
+        names = [name for name, _ in cpu_data]
+        if self._cpu_axis_x.categories() != names:
+            self._cpu_axis_x.clear()
+            self._cpu_axis_x.append(names)
             
-        # Create memory chart
-        if memory_data:
-            for name, value in memory_data:
-                slice = memory_series.append(name, value)
-                slice.setLabelVisible()
+        if values:
+            self._cpu_axis_y.setRange(0, max(values) * 1.2)  # Add 20% margin
+            
+        # Update memory chart, adding or removing only the changed slices
+        slices = self._mem_pie_series.slices()
+        for pie_slice in slices[len(memory_data):]:
+            self._mem_pie_series.remove(pie_slice)
+            
+        for i, (name, value) in enumerate(memory_data):
+            if i < len(slices):
+                slices[i].setLabel(name)
+                slices[i].setValue(value)
+            else:
+                pie_slice = self._mem_pie_series.append(name, value)
+                pie_slice.setLabelVisible()
                 
-            self.memory_chart_obj.addSeries(memory_series)
-            
     def apply_filter(self):
         """Apply filter to the services table."""
-        filter_text = self.filter_input.text().lower()
+        self.services_proxy.setFilterFixedString(self.filter_input.text())
         
-        for i in range(self.services_table.rowCount()):
-            service_name = self.services_table.item(i, 0).text().lower()
-            match = filter_text in service_name
-            self.services_table.setRowHidden(i, not match)
-            
     def show_service_dashboard(self):
         """Show the detailed dashboard for the selected service."""
         # Get the selected service
@@ -610,9 +843,9 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
             )
             return
             
-        current_row = self.services_table.currentRow()
-        service_name = self.services_table.item(current_row, 0).text()
-        pid_text = self.services_table.item(current_row, 1).text()
+        current_row = self.services_proxy.mapToSource(self.services_table.currentIndex()).row()
+        service_name = self.services_model.item(current_row, 0).text()
+        pid_text = self.services_model.item(current_row, 1).text()
         
         pid = None
         if pid_text != "N/A":
@@ -622,7 +855,7 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
                 pass
                 
         # Find the corresponding service object
-        service = next((s for s in self.services if s.name == service_name), None)
+        service = self._services_by_name.get(service_name)
         
         if not service:
             QtWidgets.QMessageBox.warning(
@@ -636,8 +869,13 @@ class ServiceMonitoringDialog(QtWidgets.QDialog):
         )
         dashboard.exec_()
         
+    def done(self, result):
+        """Stop the worker when the dialog is accepted or rejected."""
+        self.stop_stats_worker()
+        super().done(result)
+        
     def closeEvent(self, event):
         """Handle the close event."""
-        # Stop the update timer
-        self.update_timer.stop()
+        # Stop the stats worker
+        self.stop_stats_worker()
         event.accept()
\ No newline at end of file
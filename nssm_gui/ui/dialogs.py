@@ -1,18 +1,219 @@
+import codecs
 import os
+import re
+import subprocess
+import time
 from PyQt5 import QtWidgets, QtGui, QtCore
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
+from pydantic import TypeAdapter, ValidationError
 
 from ..models import ServiceConfig
+from ..service_manager import seek_log_tail
+from . import FILTER_DELAY_MS
+
+# pywin32 lists services straight from the service control manager; it is optional
+try:
+    import win32service
+except ImportError:
+    win32service = None
+
+# Built once so the validator schema is reused by every dialog
+_SERVICE_CONFIG_ADAPTER = TypeAdapter(ServiceConfig)
+
+# Choices of the combo boxes, and the index of each choice
+_STARTUP_TYPES = (
+    'SERVICE_AUTO_START',
+    'SERVICE_DELAYED_AUTO_START',
+    'SERVICE_DEMAND_START',
+    'SERVICE_DISABLED'
+)
+_STARTUP_TYPE_INDEX = {t: i for i, t in enumerate(_STARTUP_TYPES)}
+_SERVICE_TYPES = (
+    'SERVICE_WIN32_OWN_PROCESS',
+    'SERVICE_INTERACTIVE_PROCESS'
+)
+_SERVICE_TYPE_INDEX = {t: i for i, t in enumerate(_SERVICE_TYPES)}
+_PRIORITIES = (
+    'REALTIME_PRIORITY_CLASS',
+    'HIGH_PRIORITY_CLASS',
+    'ABOVE_NORMAL_PRIORITY_CLASS',
+    'NORMAL_PRIORITY_CLASS',
+    'BELOW_NORMAL_PRIORITY_CLASS',
+    'IDLE_PRIORITY_CLASS'
+)
+_PRIORITY_INDEX = {t: i for i, t in enumerate(_PRIORITIES)}
+_EXIT_ACTIONS = ('Restart', 'Ignore', 'Exit', 'Suicide')
+_EXIT_ACTION_INDEX = {t: i for i, t in enumerate(_EXIT_ACTIONS)}
+_HOOK_EVENTS = ('Start_Pre', 'Start_Post', 'Stop_Pre', 'Exit_Post', 'Power_Change', 'Power_Resume')
+_HOOK_ACTIONS = ('Execute', 'Log')
+# Name filters of the file dialogs
+_EXECUTABLE_FILTER = 'Executable Files (*.exe *.bat *.cmd);;All Files (*)'
+_LOG_FILTER = 'Log Files (*.log *.txt);;All Files (*)'
+# Size of the pieces a log file is read and shown in
+_LOG_CHUNK_BYTES = 256 * 1024
+# Most of a log file the log viewer reads, counted from its end
+_LOG_VIEW_BYTES = 16 * 1024 * 1024
+# Lines a log view keeps, to bound its memory on huge logs
+_LOG_MAX_LINES = 200000
+# Width in pixels past which a log path is elided in the middle
+_LOG_PATH_WIDTH = 700
+# Button combinations of the dialogs and message boxes
+_OK_CANCEL = QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
+_SAVE_CANCEL = QtWidgets.QDialogButtonBox.Save | QtWidgets.QDialogButtonBox.Cancel
+_YES_NO = QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+# Environment variable names: letters, numbers, and underscores. One
+# validator is shared by every EnvVariableDialog
+_ENV_NAME_VALIDATOR = QtGui.QRegularExpressionValidator(
+    QtCore.QRegularExpression(r'^[\p{L}\p{N}_]*$')
+)
+# CPUs offered for affinity, limited to 32
+_CPU_COUNT = min(os.cpu_count() or 1, 32)
+# Seconds for which the list of installed services is reused
+_SERVICES_TTL = 60.0
+# Service name lines of 'sc query' output
+_SC_NAME_RE = re.compile(r'^[ \t]*SERVICE_NAME:[ \t]*(\S.*?)[ \t]*$', re.M)
+# Time the services were listed, and their names
+_services_cache = (0.0, ())
+
+def _enum_services() -> Tuple[str, ...]:
+    """Names of the installed services, listed at most once per _SERVICES_TTL."""
+    global _services_cache
+    listed_at, services = _services_cache
+    if services and time.monotonic() - listed_at < _SERVICES_TTL:
+        return services
+        
+    if win32service is not None:
+        scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_ENUMERATE_SERVICE)
+        try:
+            statuses = win32service.EnumServicesStatus(
+                scm, win32service.SERVICE_WIN32, win32service.SERVICE_STATE_ALL
+            )
+        finally:
+            win32service.CloseServiceHandle(scm)
+        services = tuple(status[0] for status in statuses)
+    else:
+        output = subprocess.check_output(['sc', 'query', 'state=', 'all'], text=True)
+        services = tuple(_SC_NAME_RE.findall(output))
+        
+    _services_cache = (time.monotonic(), services)
+    return services
+
+def _text(widget) -> str:
+    """Text of a line edit without surrounding whitespace."""
+    return widget.text().strip()
+
+def _setv(widget, value, getter='value', setter='setValue'):
+    """Set a widget's value, skipping the call if it already holds that value."""
+    if getattr(widget, getter)() != value:
+        getattr(widget, setter)(value)
+
+def _truncate(path: str):
+    """Empty a file in place, creating it if it is missing."""
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC))
+
+def _log_path_label(path: str) -> QtWidgets.QLabel:
+    """Label naming a log file, eliding long paths to a fixed width."""
+    label = QtWidgets.QLabel()
+    elided = label.fontMetrics().elidedText(path, QtCore.Qt.ElideMiddle, _LOG_PATH_WIDTH)
+    label.setText(f"Log file: {elided}")
+    label.setToolTip(path)
+    return label
+
+class _ServicesLoaderSignals(QtCore.QObject):
+    """Signals of a _ServicesLoader."""
+    loaded = QtCore.pyqtSignal(object)  # Tuple of service names
+    failed = QtCore.pyqtSignal(str)
+    
+class _ServicesLoader(QtCore.QRunnable):
+    """Lists the installed services on a thread pool thread."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _ServicesLoaderSignals()
+        
+    def run(self):
+        """List the services and report them back through the signals."""
+        try:
+            self.signals.loaded.emit(_enum_services())
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+class _EnvModel(QtCore.QAbstractTableModel):
+    """Environment variables of a service, as editable (name, value) rows."""
+    
+    _HEADERS = ('Variable', 'Value')
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # [name, value] lists
+        
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+        
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if index.isValid() and role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+        
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+        
+    def flags(self, index):
+        return super().flags(index) | QtCore.Qt.ItemIsEditable
+        
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if not index.isValid() or role != QtCore.Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = value
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        return True
+        
+    def insertRows(self, row, count, parent=QtCore.QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._rows[row:row] = [['', ''] for _ in range(count)]
+        self.endInsertRows()
+        return True
+        
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+        
+    def set_rows(self, rows):
+        """Replace all rows with (name, value) pairs in a single reset."""
+        self.beginResetModel()
+        self._rows = [[name, value] for name, value in rows]
+        self.endResetModel()
+        
+    def set_row(self, row, name, value):
+        """Set the name and value of a row."""
+        self._rows[row] = [name, value]
+        self.dataChanged.emit(self.index(row, 0), self.index(row, 1))
+        
+    def rows(self):
+        """Return the rows as (name, value) pairs."""
+        return [(name, value) for name, value in self._rows]
 
 class AddServiceDialog(QtWidgets.QDialog):
     """Dialog for adding or editing a service."""
     
     def __init__(self, parent=None, existing_config: Optional[ServiceConfig] = None):
         super().__init__(parent)
+        # Free the dialog once closed; results are kept in plain attributes
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setWindowTitle('Add Service' if not existing_config else 'Edit Service')
         self.setFixedSize(700, 800)
         self.existing_config = existing_config
+        self._loaded_config = None
+        self._file_dialog = None
+        self.service_config = None  # Set when the dialog is accepted
         self.init_ui()
         
         if existing_config:
@@ -33,63 +234,85 @@ class AddServiceDialog(QtWidgets.QDialog):
         self.tabs.addTab(self.app_tab, 'Application')
         self.init_app_tab()
         
+        # The remaining tabs are built the first time they are shown, and
+        # each tab loads its part of the configuration once it is built;
+        # the loaders sync dependent widget states themselves
+        self._init_fns = {}
+        self._load_fns = {0: self._load_app_tab}
+        
         # Details Tab
         self.details_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.details_tab, 'Details')
-        self.init_details_tab()
+        self._add_lazy_tab(self.details_tab, 'Details', self.init_details_tab, self._load_details_tab)
         
         # Logon Tab
         self.logon_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.logon_tab, 'Logon')
-        self.init_logon_tab()
+        self._add_lazy_tab(self.logon_tab, 'Logon', self.init_logon_tab, self._load_logon_tab)
         
         # Dependencies Tab
         self.dependencies_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.dependencies_tab, 'Dependencies')
-        self.init_dependencies_tab()
+        self._add_lazy_tab(self.dependencies_tab, 'Dependencies', self.init_dependencies_tab, self._load_dependencies_tab)
         
         # Process Tab
         self.process_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.process_tab, 'Process')
-        self.init_process_tab()
+        self._add_lazy_tab(self.process_tab, 'Process', self.init_process_tab, self._load_process_tab)
         
         # I/O Tab
         self.io_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.io_tab, 'I/O')
-        self.init_io_tab()
+        self._add_lazy_tab(self.io_tab, 'I/O', self.init_io_tab, self._load_io_tab)
         
         # Environment Tab
         self.env_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.env_tab, 'Environment')
-        self.init_env_tab()
+        self._add_lazy_tab(self.env_tab, 'Environment', self.init_env_tab, self._load_env_tab)
         
         # Shutdown Tab
         self.shutdown_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.shutdown_tab, 'Shutdown')
-        self.init_shutdown_tab()
+        self._add_lazy_tab(self.shutdown_tab, 'Shutdown', self.init_shutdown_tab, self._load_shutdown_tab)
         
         # Exit Tab
         self.exit_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.exit_tab, 'Exit')
-        self.init_exit_tab()
+        self._add_lazy_tab(self.exit_tab, 'Exit', self.init_exit_tab, self._load_exit_tab)
         
         # Rotation Tab
         self.rotation_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.rotation_tab, 'Rotation')
-        self.init_rotation_tab()
+        self._add_lazy_tab(self.rotation_tab, 'Rotation', self.init_rotation_tab, self._load_rotation_tab)
         
         # Hooks Tab
         self.hooks_tab = QtWidgets.QWidget()
-        self.tabs.addTab(self.hooks_tab, 'Hooks')
-        self.init_hooks_tab()
+        self._add_lazy_tab(self.hooks_tab, 'Hooks', self.init_hooks_tab, self._load_hooks_tab)
+        
+        self.tabs.currentChanged.connect(self._ensure_tab)
         
         # Buttons
         self.button_box = QtWidgets.QDialogButtonBox()
-        self.button_box.setStandardButtons(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
+        self.button_box.setStandardButtons(_OK_CANCEL)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
         self.layout.addWidget(self.button_box)
         
+    def _add_lazy_tab(self, tab, title, init_fn, load_fn):
+        """Add a placeholder tab whose widgets are built when first shown."""
+        index = self.tabs.addTab(tab, title)
+        self._init_fns[index] = init_fn
+        self._load_fns[index] = load_fn
+        
+    def _ensure_tab(self, index):
+        """Build the widgets of a tab if that has not happened yet."""
+        init_fn = self._init_fns.pop(index, None)
+        if init_fn is not None:
+            # Build and fill the tab with a single repaint at the end
+            tab = self.tabs.widget(index)
+            tab.setUpdatesEnabled(False)
+            try:
+                init_fn()
+                if self._loaded_config is not None:
+                    self._load_fns[index](self._loaded_config)
+            finally:
+                tab.setUpdatesEnabled(True)
+            
+    def _is_tab_built(self, tab):
+        """Whether the widgets of a tab have been built."""
+        return self.tabs.indexOf(tab) not in self._init_fns
+            
     def init_app_tab(self):
         """Initialize the Application tab."""
         layout = QtWidgets.QFormLayout()
@@ -140,20 +363,12 @@ class AddServiceDialog(QtWidgets.QDialog):
         self.description_input.setMaximumHeight(100)
         
         self.startup_type_combo = QtWidgets.QComboBox()
-        self.startup_type_combo.addItems([
-            'SERVICE_AUTO_START',
-            'SERVICE_DELAYED_AUTO_START',
-            'SERVICE_DEMAND_START',
-            'SERVICE_DISABLED'
-        ])
+        self.startup_type_combo.addItems(_STARTUP_TYPES)
         self.startup_type_combo.setToolTip('Select the startup type for the service.')
         
         # Service type
         self.service_type_combo = QtWidgets.QComboBox()
-        self.service_type_combo.addItems([
-            'SERVICE_WIN32_OWN_PROCESS',
-            'SERVICE_INTERACTIVE_PROCESS'
-        ])
+        self.service_type_combo.addItems(_SERVICE_TYPES)
         self.service_type_combo.setToolTip('Select the service type.')
         
         layout.addRow('Display Name:', self.display_name_input)
@@ -177,6 +392,13 @@ class AddServiceDialog(QtWidgets.QDialog):
         
         self.system_radio.setChecked(True)
         
+        # Built-in account of each radio button; otherwise a user account is used
+        self._account_radios = (
+            (self.system_radio, 'LocalSystem'),
+            (self.service_radio, 'LocalService'),
+            (self.network_radio, 'NetworkService'),
+        )
+        
         account_layout.addWidget(self.system_radio)
         account_layout.addWidget(self.service_radio)
         account_layout.addWidget(self.network_radio)
@@ -230,9 +452,24 @@ class AddServiceDialog(QtWidgets.QDialog):
         
         self.services_filter = QtWidgets.QLineEdit()
         self.services_filter.setPlaceholderText("Filter services...")
-        self.services_filter.textChanged.connect(self.filter_services)
         
-        self.services_list = QtWidgets.QListWidget()
+        # Coalesce rapid keystrokes into a single filter pass
+        self.services_filter_timer = QtCore.QTimer(self)
+        self.services_filter_timer.setSingleShot(True)
+        self.services_filter_timer.setInterval(FILTER_DELAY_MS)
+        self.services_filter_timer.timeout.connect(self.filter_services)
+        self.services_filter.textChanged.connect(self.services_filter_timer.start)
+        
+        # The proxy filters the service names in C++
+        self._services_model = QtCore.QStringListModel(self)
+        self._services_proxy = QtCore.QSortFilterProxyModel(self)
+        self._services_proxy.setSourceModel(self._services_model)
+        self._services_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        
+        self.services_list = QtWidgets.QListView()
+        self.services_list.setModel(self._services_proxy)
+        self.services_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.services_list.setUniformItemSizes(True)
         
         services_layout.addWidget(self.services_filter)
         services_layout.addWidget(self.services_list)
@@ -244,6 +481,9 @@ class AddServiceDialog(QtWidgets.QDialog):
         dependencies_layout = QtWidgets.QVBoxLayout()
         
         self.dependencies_list = QtWidgets.QListWidget()
+        self.dependencies_list.setUniformItemSizes(True)
+        # Names in the dependencies list, for constant time duplicate checks
+        self._dependency_set = set()
         
         # Buttons
         buttons_layout = QtWidgets.QHBoxLayout()
@@ -273,91 +513,128 @@ class AddServiceDialog(QtWidgets.QDialog):
         self.populate_services_list()
         
     def populate_services_list(self):
-        """Populate the list of available services."""
-        try:
-            # This is a simplified implementation
-            # In a real application, you would get this from the OS
-            import subprocess
-            output = subprocess.check_output(['sc', 'query', 'state=', 'all'], text=True)
-            
-            services = []
-            for line in output.split('\n'):
-                if line.strip().startswith('SERVICE_NAME:'):
-                    services.append(line.strip().split(':', 1)[1].strip())
-            
-            # Add to list widget
-            self.services_list.clear()
-            self.services_list.addItems(services)
-        except Exception as e:
-            print(f"Error getting services: {str(e)}")
-        
-    def filter_services(self, text):
+        """Populate the list of available services without blocking the dialog."""
+        # Show a placeholder that cannot be picked while the services load
+        self._services_model.setStringList(["Loading..."])
+        self.services_list.setEnabled(False)
+        
+        # The pool owns the loader, so it outlives the dialog if that closes first
+        loader = _ServicesLoader()
+        loader.signals.loaded.connect(self.set_available_services)
+        loader.signals.failed.connect(self.services_failed)
+        QtCore.QThreadPool.globalInstance().start(loader)
+        
+    def set_available_services(self, services):
+        """Fill the list of available services."""
+        self._services_model.setStringList(list(services))
+        self.services_list.setEnabled(True)
+        
+    def services_failed(self, error):
+        """Handle a failure to list the available services."""
+        print(f"Error getting services: {error}")
+        self.set_available_services([])
+        
+    def filter_services(self):
         """Filter the services list based on text input."""
-        for i in range(self.services_list.count()):
-            item = self.services_list.item(i)
-            item.setHidden(text.lower() not in item.text().lower())
+        self._services_proxy.setFilterFixedString(self.services_filter.text())
         
     def add_dependency(self):
         """Add a dependency to the dependencies list."""
-        selected_items = self.services_list.selectedItems()
-        for item in selected_items:
-            # Check if already in dependencies
-            exists = False
-            for i in range(self.dependencies_list.count()):
-                if self.dependencies_list.item(i).text() == item.text():
-                    exists = True
-                    break
-            
-            if not exists:
-                self.dependencies_list.addItem(item.text())
+        selected_names = [index.data() for index in self.services_list.selectionModel().selectedIndexes()]
+        self.dependencies_list.setUpdatesEnabled(False)
+        try:
+            for name in selected_names:
+                # Skip names that are already dependencies
+                if name not in self._dependency_set:
+                    self._dependency_set.add(name)
+                    self.dependencies_list.addItem(name)
+        finally:
+            self.dependencies_list.setUpdatesEnabled(True)
         
     def remove_dependency(self):
         """Remove a dependency from the dependencies list."""
-        selected_items = self.dependencies_list.selectedItems()
-        for item in selected_items:
-            self.dependencies_list.takeItem(self.dependencies_list.row(item))
-        
+        for item in self._take_selected_items(self.dependencies_list):
+            self._dependency_set.discard(item.text())
+            
+    def _take_selected_items(self, list_widget):
+        """Remove the selected items of a list widget and return them."""
+        # Take the rows from the bottom up so the remaining rows keep their
+        # indexes, instead of looking up the row of every item
+        rows = sorted((index.row() for index in list_widget.selectedIndexes()), reverse=True)
+        list_widget.setUpdatesEnabled(False)
+        try:
+            return [list_widget.takeItem(row) for row in rows]
+        finally:
+            list_widget.setUpdatesEnabled(True)
+            
     def init_process_tab(self):
         """Initialize the Process tab."""
         layout = QtWidgets.QFormLayout()
         self.process_tab.setLayout(layout)
         
         self.priority_combo = QtWidgets.QComboBox()
-        self.priority_combo.addItems([
-            'REALTIME_PRIORITY_CLASS',
-            'HIGH_PRIORITY_CLASS',
-            'ABOVE_NORMAL_PRIORITY_CLASS',
-            'NORMAL_PRIORITY_CLASS',
-            'BELOW_NORMAL_PRIORITY_CLASS',
-            'IDLE_PRIORITY_CLASS'
-        ])
+        self.priority_combo.addItems(_PRIORITIES)
         self.priority_combo.setToolTip('Set the priority class for the service process.')
         
-        # CPU affinity
+        # CPU affinity, kept as a bitmask; the per-CPU checkboxes are only
+        # built when the user asks to configure them
         affinity_group = QtWidgets.QGroupBox("CPU Affinity")
-        affinity_layout = QtWidgets.QGridLayout()
+        affinity_layout = QtWidgets.QHBoxLayout()
         
-        self.affinity_checkboxes = []
+        self.affinity_mask = (1 << _CPU_COUNT) - 1
         
-        # Get the number of CPU cores
-        import multiprocessing
-        cpu_count = multiprocessing.cpu_count()
+        self.affinity_input = QtWidgets.QLineEdit(f"0x{self.affinity_mask:X}")
+        self.affinity_input.setReadOnly(True)
+        self.affinity_input.setToolTip('Bitmask of the CPUs the service process may run on.')
         
-        # Create checkboxes for each CPU
-        for i in range(min(cpu_count, 32)):  # Limit to 32 checkboxes
-            checkbox = QtWidgets.QCheckBox(f"CPU {i}")
-            checkbox.setChecked(True)
-            self.affinity_checkboxes.append(checkbox)
-            
-            row = i // 8
-            col = i % 8
-            affinity_layout.addWidget(checkbox, row, col)
+        self.affinity_button = QtWidgets.QPushButton("Configure CPUs...")
+        self.affinity_button.clicked.connect(self.configure_affinity)
+        
+        affinity_layout.addWidget(self.affinity_input)
+        affinity_layout.addWidget(self.affinity_button)
         
         affinity_group.setLayout(affinity_layout)
         
         layout.addRow('Process Priority:', self.priority_combo)
         layout.addRow(affinity_group)
         
+    def configure_affinity(self):
+        """Edit the CPU affinity mask with a checkbox per CPU."""
+        dialog = QtWidgets.QDialog(self)
+        dialog.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        dialog.setWindowTitle("CPU Affinity")
+        dialog_layout = QtWidgets.QVBoxLayout(dialog)
+        
+        # Create checkboxes for each CPU
+        grid = QtWidgets.QGridLayout()
+        checkboxes = []
+        for i in range(_CPU_COUNT):
+            checkbox = QtWidgets.QCheckBox(f"CPU {i}")
+            checkbox.setChecked(bool(self.affinity_mask & (1 << i)))
+            checkboxes.append(checkbox)
+            
+            row = i // 8
+            col = i % 8
+            grid.addWidget(checkbox, row, col)
+        dialog_layout.addLayout(grid)
+        
+        button_box = QtWidgets.QDialogButtonBox(_OK_CANCEL)
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        dialog_layout.addWidget(button_box)
+        
+        # Read the checkboxes on accept, before the dialog deletes them
+        def apply_mask():
+            mask = 0
+            for i, checkbox in enumerate(checkboxes):
+                if checkbox.isChecked():
+                    mask |= 1 << i
+            self.affinity_mask = mask
+            self.affinity_input.setText(f"0x{mask:X}")
+            
+        dialog.accepted.connect(apply_mask)
+        dialog.exec_()
+            
     def init_io_tab(self):
         """Initialize the I/O tab."""
         layout = QtWidgets.QFormLayout()
@@ -390,10 +667,14 @@ class AddServiceDialog(QtWidgets.QDialog):
         self.env_tab.setLayout(layout)
         
         # Environment variables table
-        self.env_table = QtWidgets.QTableWidget()
-        self.env_table.setColumnCount(2)
-        self.env_table.setHorizontalHeaderLabels(['Variable', 'Value'])
+        self._env_model = _EnvModel(self)
+        self.env_table = QtWidgets.QTableView()
+        self.env_table.setModel(self._env_model)
+        # Fixed column sizes, so sizing never measures the rows' text
+        self.env_table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.env_table.setColumnWidth(0, 200)
         self.env_table.horizontalHeader().setStretchLastSection(True)
+        self.env_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
         self.env_table.verticalHeader().setVisible(False)
         
         # Buttons
@@ -419,40 +700,37 @@ class AddServiceDialog(QtWidgets.QDialog):
         """Add an environment variable."""
         dialog = EnvVariableDialog(self)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            var_name, var_value = dialog.get_variable()
+            var_name, var_value = dialog.variable
             
             # Add to table
-            row = self.env_table.rowCount()
-            self.env_table.insertRow(row)
-            self.env_table.setItem(row, 0, QtWidgets.QTableWidgetItem(var_name))
-            self.env_table.setItem(row, 1, QtWidgets.QTableWidgetItem(var_value))
+            row = self._env_model.rowCount()
+            self._env_model.insertRows(row, 1)
+            self._env_model.set_row(row, var_name, var_value)
         
     def edit_env_variable(self):
         """Edit an environment variable."""
-        selected_rows = self.env_table.selectedItems()
+        selected_rows = self.env_table.selectionModel().selectedIndexes()
         if not selected_rows:
             return
             
         row = selected_rows[0].row()
-        var_name = self.env_table.item(row, 0).text()
-        var_value = self.env_table.item(row, 1).text()
+        var_name, var_value = self._env_model.rows()[row]
         
         dialog = EnvVariableDialog(self, var_name, var_value)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            new_name, new_value = dialog.get_variable()
+            new_name, new_value = dialog.variable
             
             # Update table
-            self.env_table.setItem(row, 0, QtWidgets.QTableWidgetItem(new_name))
-            self.env_table.setItem(row, 1, QtWidgets.QTableWidgetItem(new_value))
+            self._env_model.set_row(row, new_name, new_value)
         
     def remove_env_variable(self):
         """Remove an environment variable."""
-        selected_rows = self.env_table.selectedItems()
+        selected_rows = self.env_table.selectionModel().selectedIndexes()
         if not selected_rows:
             return
             
         row = selected_rows[0].row()
-        self.env_table.removeRow(row)
+        self._env_model.removeRows(row, 1)
         
     def init_shutdown_tab(self):
         """Initialize the Shutdown tab."""
@@ -523,7 +801,7 @@ class AddServiceDialog(QtWidgets.QDialog):
         self.throttle_delay_input.setValue(0)
         
         self.exit_action_combo = QtWidgets.QComboBox()
-        self.exit_action_combo.addItems(['Restart', 'Ignore', 'Exit', 'Suicide'])
+        self.exit_action_combo.addItems(_EXIT_ACTIONS)
         self.exit_action_combo.setToolTip('Select the action to perform on application exit.')
         
         self.restart_delay_input = QtWidgets.QSpinBox()
@@ -582,10 +860,10 @@ class AddServiceDialog(QtWidgets.QDialog):
         
         # Hook event and action
         self.hook_event_combo = QtWidgets.QComboBox()
-        self.hook_event_combo.addItems(['Start_Pre', 'Start_Post', 'Stop_Pre', 'Exit_Post', 'Power_Change', 'Power_Resume'])
+        self.hook_event_combo.addItems(_HOOK_EVENTS)
         
         self.hook_action_combo = QtWidgets.QComboBox()
-        self.hook_action_combo.addItems(['Execute', 'Log'])
+        self.hook_action_combo.addItems(_HOOK_ACTIONS)
         
         self.hook_command_input = QtWidgets.QLineEdit()
         browse_hook_button = QtWidgets.QPushButton('Browse')
@@ -601,9 +879,14 @@ class AddServiceDialog(QtWidgets.QDialog):
         
         # Hooks list
         self.hooks_list = QtWidgets.QListWidget()
+        self.hooks_list.setUniformItemSizes(True)
         self.hooks_list.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.hooks_list.customContextMenuRequested.connect(self.show_hooks_context_menu)
         
+        # Context menu of the hooks list, built once and reused
+        self._hooks_menu = QtWidgets.QMenu(self.hooks_list)
+        self._hooks_remove_action = self._hooks_menu.addAction("Remove")
+        
         layout.addRow(self.hook_share_output_handles_checkbox)
         layout.addRow('Hook Event:', self.hook_event_combo)
         layout.addRow('Hook Action:', self.hook_action_combo)
@@ -611,43 +894,51 @@ class AddServiceDialog(QtWidgets.QDialog):
         layout.addRow(self.add_hook_button)
         layout.addRow('Existing Hooks:', self.hooks_list)
         
+    def _pick_path(self, caption, file_mode, name_filter='', save=False):
+        """Ask for a path with the dialog's shared file dialog; '' if cancelled."""
+        # Build the file dialog once and reuse it for every browse button
+        if self._file_dialog is None:
+            self._file_dialog = QtWidgets.QFileDialog(self)
+            
+        dialog = self._file_dialog
+        dialog.setWindowTitle(caption)
+        dialog.setFileMode(file_mode)
+        dialog.setOption(QtWidgets.QFileDialog.ShowDirsOnly, file_mode == QtWidgets.QFileDialog.Directory)
+        dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptSave if save else QtWidgets.QFileDialog.AcceptOpen)
+        dialog.setNameFilter(name_filter)
+        dialog.selectFile('')  # Don't offer the file picked by another button
+        
+        if dialog.exec_() == QtWidgets.QDialog.Accepted and dialog.selectedFiles():
+            return dialog.selectedFiles()[0]
+        return ''
+        
     def browse_executable(self):
         """Browse for executable file."""
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, 'Select Executable', '', 'Executable Files (*.exe *.bat *.cmd);;All Files (*)'
-        )
+        path = self._pick_path('Select Executable', QtWidgets.QFileDialog.ExistingFile, _EXECUTABLE_FILTER)
         if path:
             self.executable_path_input.setText(path)
             
     def browse_app_directory(self):
         """Browse for application directory."""
-        directory = QtWidgets.QFileDialog.getExistingDirectory(
-            self, 'Select Application Directory'
-        )
+        directory = self._pick_path('Select Application Directory', QtWidgets.QFileDialog.Directory)
         if directory:
             self.app_directory_input.setText(directory)
             
     def browse_stdout(self):
         """Browse for stdout file."""
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, 'Select Output File', '', 'Log Files (*.log *.txt);;All Files (*)'
-        )
+        path = self._pick_path('Select Output File', QtWidgets.QFileDialog.AnyFile, _LOG_FILTER, save=True)
         if path:
             self.stdout_path_input.setText(path)
             
     def browse_stderr(self):
         """Browse for stderr file."""
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, 'Select Error File', '', 'Log Files (*.log *.txt);;All Files (*)'
-        )
+        path = self._pick_path('Select Error File', QtWidgets.QFileDialog.AnyFile, _LOG_FILTER, save=True)
         if path:
             self.stderr_path_input.setText(path)
             
     def browse_hook_command(self):
         """Browse for hook command file."""
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, 'Select Hook Command', '', 'Executable Files (*.exe *.bat *.cmd);;All Files (*)'
-        )
+        path = self._pick_path('Select Hook Command', QtWidgets.QFileDialog.ExistingFile, _EXECUTABLE_FILTER)
         if path:
             self.hook_command_input.setText(path)
             
@@ -663,199 +954,256 @@ class AddServiceDialog(QtWidgets.QDialog):
             )
             return
             
-        hook_entry = f"{event} - {action}: {command}"
-        self.hooks_list.addItem(hook_entry)
+        self._add_hook_item(event, action, command)
         self.hook_command_input.clear()
         
+    def _add_hook_item(self, event, action, command):
+        """Append a hook to the hooks list, keeping its fields as item data."""
+        if action:
+            label = f"{event} - {action}: {command}"
+        else:
+            label = f"{event}: {command}"
+        item = QtWidgets.QListWidgetItem(label)
+        item.setData(QtCore.Qt.UserRole, (event, action, command))
+        self.hooks_list.addItem(item)
+        
     def show_hooks_context_menu(self, position):
         """Show the context menu for the hooks list."""
-        menu = QtWidgets.QMenu()
-        remove_action = menu.addAction("Remove")
-        
-        action = menu.exec_(self.hooks_list.mapToGlobal(position))
+        action = self._hooks_menu.exec_(self.hooks_list.mapToGlobal(position))
         
-        if action == remove_action:
-            selected_items = self.hooks_list.selectedItems()
-            for item in selected_items:
-                self.hooks_list.takeItem(self.hooks_list.row(item))
+        if action == self._hooks_remove_action:
+            self._take_selected_items(self.hooks_list)
                 
     def load_service_config(self, config: ServiceConfig):
         """Load service configuration into the dialog."""
-        # Application tab
-        self.service_name_input.setText(config.service_name)
-        self.executable_path_input.setText(config.application_path)
-        self.app_directory_input.setText(config.app_directory)
-        self.arguments_input.setText(config.arguments)
-        
-        # Details tab
-        self.display_name_input.setText(config.display_name)
-        self.description_input.setText(config.description)
-        
-        index = self.startup_type_combo.findText(config.start)
-        if index != -1:
-            self.startup_type_combo.setCurrentIndex(index)
+        # Tabs that are not built yet load the configuration when they are
+        self._loaded_config = config
+        
+        self.setUpdatesEnabled(False)
+        try:
+            for index in self._load_fns:
+                if index not in self._init_fns:
+                    self._load_fns[index](config)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
             
-        index = self.service_type_combo.findText(config.type)
-        if index != -1:
-            self.service_type_combo.setCurrentIndex(index)
+    def _load_app_tab(self, config: ServiceConfig):
+        """Load the Application tab."""
+        _setv(self.service_name_input, config.service_name, 'text', 'setText')
+        _setv(self.executable_path_input, config.application_path, 'text', 'setText')
+        _setv(self.app_directory_input, config.app_directory, 'text', 'setText')
+        _setv(self.arguments_input, config.arguments, 'text', 'setText')
+        
+    def _load_details_tab(self, config: ServiceConfig):
+        """Load the Details tab."""
+        _setv(self.display_name_input, config.display_name, 'text', 'setText')
+        _setv(self.description_input, config.description, 'toPlainText', 'setPlainText')
+        
+        index = _STARTUP_TYPE_INDEX.get(config.start)
+        if index is not None:
+            _setv(self.startup_type_combo, index, 'currentIndex', 'setCurrentIndex')
             
-        # Logon tab
-        if config.object_name == 'LocalSystem':
-            self.system_radio.setChecked(True)
-        elif config.object_name == 'LocalService':
-            self.service_radio.setChecked(True)
-        elif config.object_name == 'NetworkService':
-            self.network_radio.setChecked(True)
-        else:
-            self.user_radio.setChecked(True)
-            self.username_input.setText(config.object_name)
+        index = _SERVICE_TYPE_INDEX.get(config.type)
+        if index is not None:
+            _setv(self.service_type_combo, index, 'currentIndex', 'setCurrentIndex')
             
-        # Dependencies tab
+    def _load_logon_tab(self, config: ServiceConfig):
+        """Load the Logon tab."""
+        # Each setChecked would emit toggled on two radios; sync once instead
+        with QtCore.QSignalBlocker(self.system_radio), QtCore.QSignalBlocker(self.service_radio), \
+                QtCore.QSignalBlocker(self.network_radio), QtCore.QSignalBlocker(self.user_radio):
+            radio = next((r for r, account in self._account_radios if account == config.object_name), None)
+            if radio is not None:
+                radio.setChecked(True)
+            else:
+                self.user_radio.setChecked(True)
+                _setv(self.username_input, config.object_name, 'text', 'setText')
+                
+        self.toggle_user_inputs(self.user_radio.isChecked())
+        
+    def _load_dependencies_tab(self, config: ServiceConfig):
+        """Load the Dependencies tab."""
         self.dependencies_list.clear()
-        for dependency in config.dependencies:
-            self.dependencies_list.addItem(dependency)
+        self._dependency_set = set(config.dependencies)
+        self.dependencies_list.addItems(list(config.dependencies))
             
-        # Process tab
-        index = self.priority_combo.findText(config.process_priority)
-        if index != -1:
-            self.priority_combo.setCurrentIndex(index)
+    def _load_process_tab(self, config: ServiceConfig):
+        """Load the Process tab."""
+        index = _PRIORITY_INDEX.get(config.process_priority)
+        if index is not None:
+            _setv(self.priority_combo, index, 'currentIndex', 'setCurrentIndex')
             
-        # I/O tab
-        self.stdout_path_input.setText(config.stdout_path)
-        self.stderr_path_input.setText(config.stderr_path)
-        
-        # Environment tab
-        self.env_table.setRowCount(0)
-        for key, value in config.env_variables.items():
-            row = self.env_table.rowCount()
-            self.env_table.insertRow(row)
-            self.env_table.setItem(row, 0, QtWidgets.QTableWidgetItem(key))
-            self.env_table.setItem(row, 1, QtWidgets.QTableWidgetItem(value))
+    def _load_io_tab(self, config: ServiceConfig):
+        """Load the I/O tab."""
+        _setv(self.stdout_path_input, config.stdout_path, 'text', 'setText')
+        _setv(self.stderr_path_input, config.stderr_path, 'text', 'setText')
+        
+    def _load_env_tab(self, config: ServiceConfig):
+        """Load the Environment tab."""
+        self._env_model.set_rows(config.env_variables.items())
             
-        # Shutdown tab
-        self.method_console_checkbox.setChecked(config.kill_console_delay > 0)
-        self.console_delay_input.setValue(config.kill_console_delay)
-        
-        self.method_window_checkbox.setChecked(config.kill_window_delay > 0)
-        self.window_delay_input.setValue(config.kill_window_delay)
+    def _load_shutdown_tab(self, config: ServiceConfig):
+        """Load the Shutdown tab."""
+        with QtCore.QSignalBlocker(self.method_console_checkbox), QtCore.QSignalBlocker(self.method_window_checkbox), \
+                QtCore.QSignalBlocker(self.method_threads_checkbox):
+            _setv(self.method_console_checkbox, config.kill_console_delay > 0, 'isChecked', 'setChecked')
+            _setv(self.method_window_checkbox, config.kill_window_delay > 0, 'isChecked', 'setChecked')
+            _setv(self.method_threads_checkbox, config.kill_threads_delay > 0, 'isChecked', 'setChecked')
+            
+        _setv(self.console_delay_input, config.kill_console_delay)
+        _setv(self.window_delay_input, config.kill_window_delay)
+        _setv(self.threads_delay_input, config.kill_threads_delay)
         
-        self.method_threads_checkbox.setChecked(config.kill_threads_delay > 0)
-        self.threads_delay_input.setValue(config.kill_threads_delay)
+        _setv(self.kill_process_tree_checkbox, config.kill_process_tree, 'isChecked', 'setChecked')
         
-        self.kill_process_tree_checkbox.setChecked(config.kill_process_tree)
+        self.toggle_console_delay(self.method_console_checkbox.checkState())
+        self.toggle_window_delay(self.method_window_checkbox.checkState())
+        self.toggle_threads_delay(self.method_threads_checkbox.checkState())
         
-        # Exit tab
-        self.throttle_delay_input.setValue(config.throttle_delay)
+    def _load_exit_tab(self, config: ServiceConfig):
+        """Load the Exit tab."""
+        _setv(self.throttle_delay_input, config.throttle_delay)
         
-        index = self.exit_action_combo.findText(config.app_exit)
-        if index != -1:
-            self.exit_action_combo.setCurrentIndex(index)
+        index = _EXIT_ACTION_INDEX.get(config.app_exit)
+        if index is not None:
+            _setv(self.exit_action_combo, index, 'currentIndex', 'setCurrentIndex')
             
-        self.restart_delay_input.setValue(config.restart_delay)
+        _setv(self.restart_delay_input, config.restart_delay)
+        
+    def _load_rotation_tab(self, config: ServiceConfig):
+        """Load the Rotation tab."""
+        with QtCore.QSignalBlocker(self.rotate_files_checkbox):
+            _setv(self.rotate_files_checkbox, config.rotate_files, 'isChecked', 'setChecked')
+        _setv(self.rotate_online_checkbox, config.rotate_online, 'isChecked', 'setChecked')
+        _setv(self.rotate_seconds_input, config.rotate_seconds)
+        _setv(self.rotate_bytes_low_input, config.rotate_bytes_low)
         
-        # Rotation tab
-        self.rotate_files_checkbox.setChecked(config.rotate_files)
-        self.rotate_online_checkbox.setChecked(config.rotate_online)
-        self.rotate_seconds_input.setValue(config.rotate_seconds)
-        self.rotate_bytes_low_input.setValue(config.rotate_bytes_low)
+        self.toggle_rotation_settings(self.rotate_files_checkbox.checkState())
         
-        # Hooks tab
-        self.hook_share_output_handles_checkbox.setChecked(config.hook_share_output_handles)
+    def _load_hooks_tab(self, config: ServiceConfig):
+        """Load the Hooks tab."""
+        _setv(self.hook_share_output_handles_checkbox, config.hook_share_output_handles, 'isChecked', 'setChecked')
         
-        self.hooks_list.clear()
-        for event, action in config.hooks.items():
-            hook_entry = f"{event} - {action}"
-            self.hooks_list.addItem(hook_entry)
+        self.hooks_list.setUpdatesEnabled(False)
+        try:
+            self.hooks_list.clear()
+            for event, command in config.hooks.items():
+                # The configuration only keeps the command of each hook
+                self._add_hook_item(event, '', command)
+        finally:
+            self.hooks_list.setUpdatesEnabled(True)
+            
+    def _validate(self) -> Tuple[bool, str]:
+        """Check the required fields, returning (ok, error message)."""
+        if not _text(self.service_name_input):
+            return False, 'Service Name is required.'
+            
+        if not _text(self.executable_path_input) and not self.existing_config:
+            return False, 'Executable Path is required.'
+            
+        if self._is_tab_built(self.logon_tab) and self.user_radio.isChecked() \
+                and not _text(self.username_input):
+            return False, 'Username is required for a user account.'
             
+        return True, ''
+        
     def get_service_config(self) -> Optional[ServiceConfig]:
         """Get the service configuration from the dialog."""
         try:
-            # Basic validation
-            service_name = self.service_name_input.text().strip()
-            executable_path = self.executable_path_input.text().strip()
-            
-            if not service_name:
-                QtWidgets.QMessageBox.warning(
-                    self, 'Input Error', 'Service Name is required.'
-                )
+            # Check the required fields before reading everything else
+            ok, message = self._validate()
+            if not ok:
+                QtWidgets.QMessageBox.warning(self, 'Input Error', message)
                 return None
                 
-            if not executable_path and not self.existing_config:
-                QtWidgets.QMessageBox.warning(
-                    self, 'Input Error', 'Executable Path is required.'
-                )
-                return None
-                
-            # Build the config dictionary
-            config_dict = {
+            service_name = _text(self.service_name_input)
+            executable_path = _text(self.executable_path_input)
+            
+            # Tabs that were never opened keep the loaded (or default) values,
+            # so their widgets never have to be built
+            base_config = self._loaded_config or ServiceConfig.model_construct()
+            config_dict = base_config.model_dump()
+            
+            # Application settings
+            config_dict.update({
                 'service_name': service_name,
                 'application_path': executable_path,
-                'arguments': self.arguments_input.text().strip(),
-                'app_directory': self.app_directory_input.text().strip(),
-                'display_name': self.display_name_input.text().strip(),
-                'description': self.description_input.toPlainText().strip(),
-                'start': self.startup_type_combo.currentText(),
-                'type': self.service_type_combo.currentText(),
-                'process_priority': self.priority_combo.currentText(),
-                'stdout_path': self.stdout_path_input.text().strip(),
-                'stderr_path': self.stderr_path_input.text().strip(),
-            }
+                'arguments': _text(self.arguments_input),
+                'app_directory': _text(self.app_directory_input),
+            })
             
-            # Object name (logon account)
-            if self.system_radio.isChecked():
-                config_dict['object_name'] = 'LocalSystem'
-            elif self.service_radio.isChecked():
-                config_dict['object_name'] = 'LocalService'
-            elif self.network_radio.isChecked():
-                config_dict['object_name'] = 'NetworkService'
-            else:
-                config_dict['object_name'] = self.username_input.text().strip()
+            # Details settings
+            if self._is_tab_built(self.details_tab):
+                config_dict.update({
+                    'display_name': _text(self.display_name_input),
+                    'description': self.description_input.toPlainText().strip(),
+                    'start': self.startup_type_combo.currentText(),
+                    'type': self.service_type_combo.currentText(),
+                })
                 
+            # Object name (logon account)
+            if self._is_tab_built(self.logon_tab):
+                config_dict['object_name'] = next(
+                    (account for radio, account in self._account_radios if radio.isChecked()),
+                    _text(self.username_input)
+                )
+                    
             # Dependencies
-            dependencies = []
-            for i in range(self.dependencies_list.count()):
-                dependencies.append(self.dependencies_list.item(i).text())
-            config_dict['dependencies'] = dependencies
-            
+            if self._is_tab_built(self.dependencies_tab):
+                item = self.dependencies_list.item
+                config_dict['dependencies'] = [item(i).text() for i in range(self.dependencies_list.count())]
+                
+            # Process settings
+            if self._is_tab_built(self.process_tab):
+                config_dict['process_priority'] = self.priority_combo.currentText()
+                
+            # I/O settings
+            if self._is_tab_built(self.io_tab):
+                config_dict['stdout_path'] = _text(self.stdout_path_input)
+                config_dict['stderr_path'] = _text(self.stderr_path_input)
+                
             # Environment variables
-            env_variables = {}
-            for i in range(self.env_table.rowCount()):
-                key = self.env_table.item(i, 0).text()
-                value = self.env_table.item(i, 1).text()
-                env_variables[key] = value
-            config_dict['env_variables'] = env_variables
-            
+            if self._is_tab_built(self.env_tab):
+                config_dict['env_variables'] = dict(self._env_model.rows())
+                
             # Shutdown settings
-            config_dict['kill_console_delay'] = self.console_delay_input.value() if self.method_console_checkbox.isChecked() else 0
-            config_dict['kill_window_delay'] = self.window_delay_input.value() if self.method_window_checkbox.isChecked() else 0
-            config_dict['kill_threads_delay'] = self.threads_delay_input.value() if self.method_threads_checkbox.isChecked() else 0
-            config_dict['kill_process_tree'] = self.kill_process_tree_checkbox.isChecked()
-            
+            if self._is_tab_built(self.shutdown_tab):
+                config_dict['kill_console_delay'] = self.console_delay_input.value() if self.method_console_checkbox.isChecked() else 0
+                config_dict['kill_window_delay'] = self.window_delay_input.value() if self.method_window_checkbox.isChecked() else 0
+                config_dict['kill_threads_delay'] = self.threads_delay_input.value() if self.method_threads_checkbox.isChecked() else 0
+                config_dict['kill_process_tree'] = self.kill_process_tree_checkbox.isChecked()
+                
             # Exit settings
-            config_dict['throttle_delay'] = self.throttle_delay_input.value()
-            config_dict['app_exit'] = self.exit_action_combo.currentText()
-            config_dict['restart_delay'] = self.restart_delay_input.value()
-            
+            if self._is_tab_built(self.exit_tab):
+                config_dict['throttle_delay'] = self.throttle_delay_input.value()
+                config_dict['app_exit'] = self.exit_action_combo.currentText()
+                config_dict['restart_delay'] = self.restart_delay_input.value()
+                
             # Rotation settings
-            config_dict['rotate_files'] = self.rotate_files_checkbox.isChecked()
-            config_dict['rotate_online'] = self.rotate_online_checkbox.isChecked()
-            config_dict['rotate_seconds'] = self.rotate_seconds_input.value()
-            config_dict['rotate_bytes_low'] = self.rotate_bytes_low_input.value()
-            
+            if self._is_tab_built(self.rotation_tab):
+                config_dict['rotate_files'] = self.rotate_files_checkbox.isChecked()
+                config_dict['rotate_online'] = self.rotate_online_checkbox.isChecked()
+                config_dict['rotate_seconds'] = self.rotate_seconds_input.value()
+                config_dict['rotate_bytes_low'] = self.rotate_bytes_low_input.value()
+                
             # Hooks settings
-            config_dict['hook_share_output_handles'] = self.hook_share_output_handles_checkbox.isChecked()
-            
-            hooks = {}
-            for i in range(self.hooks_list.count()):
-                hook_entry = self.hooks_list.item(i).text()
-                if ' - ' in hook_entry and ': ' in hook_entry:
-                    event_action, command = hook_entry.split(': ', 1)
-                    event, action = event_action.split(' - ', 1)
-                    hooks[event] = command
-            config_dict['hooks'] = hooks
-            
+            if self._is_tab_built(self.hooks_tab):
+                config_dict['hook_share_output_handles'] = self.hook_share_output_handles_checkbox.isChecked()
+                
+                # Each item keeps its (event, action, command) as user data
+                item = self.hooks_list.item
+                hook_data = [item(i).data(QtCore.Qt.UserRole) for i in range(self.hooks_list.count())]
+                config_dict['hooks'] = {event: command for event, action, command in hook_data}
+                
             # Create and return the config object
-            return ServiceConfig(**config_dict)
+            return _SERVICE_CONFIG_ADAPTER.validate_python(config_dict)
+        except ValidationError as e:
+            messages = '\n'.join(error['msg'] for error in e.errors())
+            QtWidgets.QMessageBox.warning(
+                self, 'Input Error', f'Invalid service configuration:\n{messages}'
+            )
+            return None
         except Exception as e:
             QtWidgets.QMessageBox.critical(
                 self, 'Error', f'Failed to create service configuration: {str(e)}'
@@ -867,6 +1215,7 @@ class AddServiceDialog(QtWidgets.QDialog):
         # Skip validation if the user clicked Cancel
         config = self.get_service_config()
         if config:
+            self.service_config = config
             super().accept()
         # Otherwise, keep the dialog open
             
@@ -875,7 +1224,9 @@ class EnvVariableDialog(QtWidgets.QDialog):
     
     def __init__(self, parent=None, var_name="", var_value=""):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setWindowTitle('Environment Variable')
+        self.variable = None  # Set when the dialog is accepted
         self.init_ui()
         
         # Set initial values if provided
@@ -889,13 +1240,12 @@ class EnvVariableDialog(QtWidgets.QDialog):
         
         self.name_input = QtWidgets.QLineEdit()
         self.name_input.setPlaceholderText('Variable name')
+        self.name_input.setValidator(_ENV_NAME_VALIDATOR)
         
         self.value_input = QtWidgets.QLineEdit()
         self.value_input.setPlaceholderText('Variable value')
         
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
-        )
+        button_box = QtWidgets.QDialogButtonBox(_OK_CANCEL)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         
@@ -917,31 +1267,72 @@ class EnvVariableDialog(QtWidgets.QDialog):
             return
             
         # Validate variable name (letters, numbers, and underscores)
-        if not all(c.isalnum() or c == '_' for c in name):
+        if not self.name_input.hasAcceptableInput():
             QtWidgets.QMessageBox.warning(
                 self, 'Input Error', 'Variable name can only contain letters, numbers, and underscores.'
             )
             return
             
+        self.variable = self.get_variable()
         super().accept()
         
 
+class LogReader(QtCore.QObject):
+    """Reads a log file in chunks on a worker thread."""
+    
+    chunk_ready = QtCore.pyqtSignal(str)  # Whole lines of the log
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        
+    @QtCore.pyqtSlot()
+    def read(self):
+        """Emit the end of the log file chunk by chunk; runs on the worker thread."""
+        if not self.path:
+            self.chunk_ready.emit("No log path configured.")
+            return
+            
+        if not os.path.exists(self.path):
+            self.chunk_ready.emit(f"Log file {self.path} does not exist.")
+            return
+            
+        try:
+            thread = QtCore.QThread.currentThread()
+            with open(self.path, 'rb') as f:
+                seek_log_tail(f, _LOG_VIEW_BYTES)
+                decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+                pending = ''
+                while not thread.isInterruptionRequested():
+                    data = f.read(_LOG_CHUNK_BYTES)
+                    text = pending + decoder.decode(data, final=not data)
+                    if not data:
+                        if text:
+                            self.chunk_ready.emit(text)
+                        break
+                        
+                    # Each append starts a new line, so only emit whole lines
+                    lines, newline, pending = text.rpartition('\n')
+                    if newline:
+                        self.chunk_ready.emit(lines)
+        except Exception as e:
+            self.chunk_ready.emit(f"Error reading log file {self.path}: {str(e)}")
+            
 class LogViewerDialog(QtWidgets.QDialog):
     """Dialog for viewing service logs."""
     
-    def __init__(self, parent=None, service_name="", stdout_logs="", stderr_logs="", 
-                 stdout_path="", stderr_path=""):
+    def __init__(self, parent=None, service_name="", stdout_path="", stderr_path=""):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setWindowTitle(f'Logs for {service_name}')
         self.setGeometry(100, 100, 800, 600)
         
         self.service_name = service_name
-        self.stdout_logs = stdout_logs
-        self.stderr_logs = stderr_logs
         self.stdout_path = stdout_path
         self.stderr_path = stderr_path
         
         self.init_ui()
+        self.setup_log_readers()
         
     def init_ui(self):
         """Initialize the dialog UI."""
@@ -957,9 +1348,9 @@ class LogViewerDialog(QtWidgets.QDialog):
         self.stdout_text = QtWidgets.QPlainTextEdit()
         self.stdout_text.setReadOnly(True)
         self.stdout_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-        self.stdout_text.setPlainText(self.stdout_logs)
+        self.stdout_text.setMaximumBlockCount(_LOG_MAX_LINES)
         
-        stdout_path_label = QtWidgets.QLabel(f"Log file: {self.stdout_path}")
+        stdout_path_label = _log_path_label(self.stdout_path)
         
         stdout_layout.addWidget(stdout_path_label)
         stdout_layout.addWidget(self.stdout_text)
@@ -971,9 +1362,9 @@ class LogViewerDialog(QtWidgets.QDialog):
         self.stderr_text = QtWidgets.QPlainTextEdit()
         self.stderr_text.setReadOnly(True)
         self.stderr_text.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
-        self.stderr_text.setPlainText(self.stderr_logs)
+        self.stderr_text.setMaximumBlockCount(_LOG_MAX_LINES)
         
-        stderr_path_label = QtWidgets.QLabel(f"Log file: {self.stderr_path}")
+        stderr_path_label = _log_path_label(self.stderr_path)
         
         stderr_layout.addWidget(stderr_path_label)
         stderr_layout.addWidget(self.stderr_text)
@@ -1006,6 +1397,37 @@ class LogViewerDialog(QtWidgets.QDialog):
         layout.addWidget(self.tabs)
         layout.addLayout(button_layout)
         
+    def setup_log_readers(self):
+        """Stream the log files into their views from a worker thread."""
+        self._log_thread = QtCore.QThread(self)
+        self._log_readers = []
+        for path, view in ((self.stdout_path, self.stdout_text), (self.stderr_path, self.stderr_text)):
+            reader = LogReader(path)
+            reader.moveToThread(self._log_thread)
+            self._log_thread.started.connect(reader.read)
+            self._log_thread.finished.connect(reader.deleteLater)
+            reader.chunk_ready.connect(view.appendPlainText, QtCore.Qt.QueuedConnection)
+            self._log_readers.append(reader)
+        self._log_thread.start()
+        
+    def stop_log_readers(self):
+        """Stop the log reader thread."""
+        if self._log_thread is not None:
+            self._log_thread.requestInterruption()
+            self._log_thread.quit()
+            self._log_thread.wait()
+            self._log_thread = None
+            
+    def done(self, result):
+        """Stop reading logs when the dialog is accepted or rejected."""
+        self.stop_log_readers()
+        super().done(result)
+        
+    def closeEvent(self, event):
+        """Handle the close event."""
+        self.stop_log_readers()
+        event.accept()
+        
     def refresh_logs(self):
         """Refresh the logs."""
         # This would need to fetch the logs again from the service
@@ -1027,14 +1449,13 @@ class LogViewerDialog(QtWidgets.QDialog):
             reply = QtWidgets.QMessageBox.question(
                 self, "Confirm Clear",
                 f"Are you sure you want to clear the stdout log file?\n{self.stdout_path}",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                _YES_NO,
                 QtWidgets.QMessageBox.No
             )
             
             if reply == QtWidgets.QMessageBox.Yes:
                 try:
-                    with open(self.stdout_path, 'w') as f:
-                        pass
+                    _truncate(self.stdout_path)
                     self.stdout_text.clear()
                     QtWidgets.QMessageBox.information(
                         self, "Success", "Stdout log file cleared."
@@ -1053,14 +1474,13 @@ class LogViewerDialog(QtWidgets.QDialog):
             reply = QtWidgets.QMessageBox.question(
                 self, "Confirm Clear",
                 f"Are you sure you want to clear the stderr log file?\n{self.stderr_path}",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                _YES_NO,
                 QtWidgets.QMessageBox.No
             )
             
             if reply == QtWidgets.QMessageBox.Yes:
                 try:
-                    with open(self.stderr_path, 'w') as f:
-                        pass
+                    _truncate(self.stderr_path)
                     self.stderr_text.clear()
                     QtWidgets.QMessageBox.information(
                         self, "Success", "Stderr log file cleared."
@@ -1075,13 +1495,13 @@ class LogViewerDialog(QtWidgets.QDialog):
         current_tab = self.tabs.currentIndex()
         
         if current_tab == 0:  # stdout
-            log_text = self.stdout_text.toPlainText()
+            document = self.stdout_text.document()
             file_type = "stdout"
         else:  # stderr
-            log_text = self.stderr_text.toPlainText()
+            document = self.stderr_text.document()
             file_type = "stderr"
             
-        if not log_text:
+        if document.isEmpty():
             QtWidgets.QMessageBox.warning(
                 self, "Warning", f"No {file_type} logs to save."
             )
@@ -1094,8 +1514,15 @@ class LogViewerDialog(QtWidgets.QDialog):
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(log_text)
+                # Write block by block rather than copying the whole log into one string
+                with open(file_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    block = document.begin()
+                    f.write(block.text())
+                    block = block.next()
+                    while block.isValid():
+                        f.write('\n')
+                        f.write(block.text())
+                        block = block.next()
                 QtWidgets.QMessageBox.information(
                     self, "Success", f"{file_type.capitalize()} logs saved to {file_path}"
                 )
@@ -1108,10 +1535,22 @@ class LogViewerDialog(QtWidgets.QDialog):
 class PreferencesDialog(QtWidgets.QDialog):
     """Dialog for application preferences."""
     
+    # Values used for preferences the parent does not have
+    _DEFAULTS = {
+        'auto_refresh': True,
+        'refresh_interval': 5000,
+        'confirm_actions': True,
+        'show_details_panel': True,
+        'dark_mode': False,
+        'font_size': 9
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
         self.setWindowTitle('Preferences')
         self.setFixedSize(400, 300)
+        self.preferences = None  # Set when the dialog is accepted
         
         self.init_ui()
         self.load_preferences()
@@ -1167,9 +1606,7 @@ class PreferencesDialog(QtWidgets.QDialog):
         layout.addStretch(1)
         
         # Buttons
-        button_box = QtWidgets.QDialogButtonBox(
-            QtWidgets.QDialogButtonBox.Save | QtWidgets.QDialogButtonBox.Cancel
-        )
+        button_box = QtWidgets.QDialogButtonBox(_SAVE_CANCEL)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         
@@ -1177,15 +1614,16 @@ class PreferencesDialog(QtWidgets.QDialog):
         
     def load_preferences(self):
         """Load preferences from the parent application."""
-        if hasattr(self.parent(), 'preferences'):
-            prefs = self.parent().preferences
+        parent_prefs = getattr(self.parent(), 'preferences', None)
+        if parent_prefs is not None:
+            prefs = {**self._DEFAULTS, **parent_prefs}
             
-            self.auto_refresh_check.setChecked(prefs.get('auto_refresh', True))
-            self.refresh_interval_spin.setValue(prefs.get('refresh_interval', 5000) // 1000)
-            self.confirm_actions_check.setChecked(prefs.get('confirm_actions', True))
-            self.show_details_check.setChecked(prefs.get('show_details_panel', True))
-            self.dark_mode_check.setChecked(prefs.get('dark_mode', False))
-            self.font_size_spin.setValue(prefs.get('font_size', 9))
+            self.auto_refresh_check.setChecked(prefs['auto_refresh'])
+            self.refresh_interval_spin.setValue(prefs['refresh_interval'] // 1000)
+            self.confirm_actions_check.setChecked(prefs['confirm_actions'])
+            self.show_details_check.setChecked(prefs['show_details_panel'])
+            self.dark_mode_check.setChecked(prefs['dark_mode'])
+            self.font_size_spin.setValue(prefs['font_size'])
         
     def get_preferences(self) -> dict:
         """Get the preferences as a dictionary."""
@@ -1196,4 +1634,9 @@ class PreferencesDialog(QtWidgets.QDialog):
             'show_details_panel': self.show_details_check.isChecked(),
             'dark_mode': self.dark_mode_check.isChecked(),
             'font_size': self.font_size_spin.value()
-        }
\ No newline at end of file
+        }
+        
+    def accept(self):
+        """Accept the dialog."""
+        self.preferences = self.get_preferences()
+        super().accept()
\ No newline at end of file
@@ -1,21 +1,46 @@
 import os
 import sys
 import asyncio
+import difflib
 from PyQt5 import QtWidgets, QtGui, QtCore
 import logging
 from typing import List, Optional, Dict
 
 from ..models import ServiceConfig, ServiceInfo
 from ..service_manager import NSSmManager
+from . import FILTER_DELAY_MS
 from .dialogs import AddServiceDialog, LogViewerDialog, PreferencesDialog
 
 class ServiceTableModel(QtCore.QAbstractTableModel):
     """Custom table model for service information."""
     
+    # State colors, shared instead of created for every painted cell
+    _RUNNING_BG = QtGui.QColor(200, 255, 200)  # Light green
+    _STOPPED_BG = QtGui.QColor(255, 200, 200)  # Light red
+    
     def __init__(self, services: List[ServiceInfo] = None):
         super().__init__()
         self.services = services or []
         self.headers = ["Service Name", "Display Name", "State", "PID"]
+        self._rows = [self._display_row(service) for service in self.services]
+        
+    @classmethod
+    def _display_row(cls, service: ServiceInfo) -> tuple:
+        """Cell texts and background of a service, computed once per update."""
+        texts = (
+            service.name,
+            service.display_name,
+            service.state,
+            str(service.pid) if service.pid is not None else "",
+        )
+        state = service.state.lower()
+        if state == "running":
+            background = cls._RUNNING_BG
+        elif state == "stopped":
+            background = cls._STOPPED_BG
+        else:
+            background = None
+        return texts, background
         
     def rowCount(self, parent=None):
         return len(self.services)
@@ -24,29 +49,12 @@ class ServiceTableModel(QtCore.QAbstractTableModel):
         return len(self.headers)
         
     def data(self, index, role):
-        if not index.isValid():
-            return None
-            
         if role == QtCore.Qt.DisplayRole:
-            service = self.services[index.row()]
-            col = index.column()
-            
-            if col == 0:
-                return service.name
-            elif col == 1:
-                return service.display_name
-            elif col == 2:
-                return service.state
-            elif col == 3:
-                return str(service.pid) if service.pid is not None else ""
-                
+            if index.isValid():
+                return self._rows[index.row()][0][index.column()]
         elif role == QtCore.Qt.BackgroundRole:
-            service = self.services[index.row()]
-            if service.state.lower() == "running":
-                return QtGui.QColor(200, 255, 200)  # Light green
-            elif service.state.lower() == "stopped":
-                return QtGui.QColor(255, 200, 200)  # Light red
-                
+            if index.isValid():
+                return self._rows[index.row()][1]
         return None
         
     def headerData(self, section, orientation, role):
@@ -55,15 +63,81 @@ class ServiceTableModel(QtCore.QAbstractTableModel):
         return None
         
     def update_services(self, services: List[ServiceInfo]):
-        self.beginResetModel()
+        """
+        Replace the services, updating only the rows that changed.
+        
+        Added and removed services are inserted and removed as row ranges,
+        and services whose cells changed emit dataChanged, so views keep
+        their selection and scroll position across refreshes.
+        """
+        new_rows = [self._display_row(service) for service in services]
+        old_names = [service.name for service in self.services]
+        new_names = [service.name for service in services]
+        
+        if old_names != new_names:
+            self.services = list(self.services)
+            matcher = difflib.SequenceMatcher(None, old_names, new_names, autojunk=False)
+            # Work from the end so earlier row numbers stay valid
+            for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+                if tag in ('delete', 'replace'):
+                    self.beginRemoveRows(QtCore.QModelIndex(), i1, i2 - 1)
+                    del self.services[i1:i2]
+                    del self._rows[i1:i2]
+                    self.endRemoveRows()
+                if tag in ('insert', 'replace'):
+                    self.beginInsertRows(QtCore.QModelIndex(), i1, i1 + j2 - j1 - 1)
+                    self.services[i1:i1] = services[j1:j2]
+                    self._rows[i1:i1] = new_rows[j1:j2]
+                    self.endInsertRows()
+                    
+        # The rows now line up with the new services; refresh changed cells
+        changed = [
+            row for row, (old, new) in enumerate(zip(self._rows, new_rows))
+            if old[0] != new[0] or old[1] is not new[1]
+        ]
         self.services = services
-        self.endResetModel()
+        self._rows = new_rows
+        
+        last_column = len(self.headers) - 1
+        roles = [QtCore.Qt.DisplayRole, QtCore.Qt.BackgroundRole]
+        for row in changed:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_column), roles)
         
     def get_service(self, row: int) -> Optional[ServiceInfo]:
         if 0 <= row < len(self.services):
             return self.services[row]
         return None
 
+class ServiceFilterProxy(QtCore.QSortFilterProxyModel):
+    """Proxy filtering services by name and state in a single pass."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._text = ""
+        self._status = "all"
+        self.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        
+    def set_text(self, text: str):
+        """Show only services whose name contains text (case-insensitive)."""
+        text = text.lower()
+        if text != self._text:
+            self._text = text
+            self.invalidateFilter()
+        
+    def set_status(self, status: str):
+        """Show only services in the given state, or all for "All"."""
+        status = status.lower()
+        if status != self._status:
+            self._status = status
+            self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        service = self.sourceModel().get_service(source_row)
+        if service is None:
+            return False
+        return ((not self._text or self._text in service.name.lower()) and
+                (self._status == "all" or service.state.lower() == self._status))
+
 class NSSmGUI(QtWidgets.QMainWindow):
     """Main window for the NSSM GUI application."""
     
@@ -100,7 +174,13 @@ class NSSmGUI(QtWidgets.QMainWindow):
         self.filter_label = QtWidgets.QLabel("Filter:")
         self.filter_input = QtWidgets.QLineEdit()
         self.filter_input.setPlaceholderText("Filter services by name...")
-        self.filter_input.textChanged.connect(self.apply_filter)
+        
+        # Apply the filter once typing pauses rather than on every keystroke
+        self._filter_debounce = QtCore.QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(FILTER_DELAY_MS)
+        self._filter_debounce.timeout.connect(self.apply_filter)
+        self.filter_input.textChanged.connect(self._filter_debounce.start)
         
         self.status_filter_combo = QtWidgets.QComboBox()
         self.status_filter_combo.addItems(["All", "Running", "Stopped"])
@@ -124,9 +204,12 @@ class NSSmGUI(QtWidgets.QMainWindow):
         self.service_table.setAlternatingRowColors(True)
         self.service_table.doubleClicked.connect(self.edit_service)
         
-        # Set up the table model
+        # Set up the table model, shown through a persistent filter proxy
         self.table_model = ServiceTableModel()
-        self.service_table.setModel(self.table_model)
+        self.proxy_model = ServiceFilterProxy(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.service_table.setModel(self.proxy_model)
+        self.service_table.sortByColumn(0, QtCore.Qt.AscendingOrder)
         
         self.main_layout.addWidget(self.service_table, 1)
         
@@ -321,33 +404,8 @@ class NSSmGUI(QtWidgets.QMainWindow):
             
     def apply_filter(self):
         """Apply the filter to the service table."""
-        # Get the current filter text
-        filter_text = self.filter_input.text().lower()
-        status_filter = self.status_filter_combo.currentText()
-        
-        # Create a proxy model for filtering
-        proxy_model = QtCore.QSortFilterProxyModel()
-        proxy_model.setSourceModel(self.table_model)
-        
-        # Set up the filter
-        proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
-        proxy_model.setFilterKeyColumn(0)  # Filter on the service name column
-        
-        # Apply the text filter
-        proxy_model.setFilterRegExp(filter_text)
-        
-        # Apply status filter
-        if status_filter != "All":
-            for row in range(self.table_model.rowCount()):
-                service = self.table_model.get_service(row)
-                if service:
-                    if status_filter == "Running" and service.state.lower() != "running":
-                        proxy_model.setFilterFixedString("THIS_WILL_NOT_MATCH_ANYTHING")
-                    elif status_filter == "Stopped" and service.state.lower() != "stopped":
-                        proxy_model.setFilterFixedString("THIS_WILL_NOT_MATCH_ANYTHING")
-        
-        # Set the proxy model on the table
-        self.service_table.setModel(proxy_model)
+        self.proxy_model.set_text(self.filter_input.text())
+        self.proxy_model.set_status(self.status_filter_combo.currentText())
         
     def refresh_services(self):
         """Refresh the services list."""
@@ -392,7 +450,7 @@ class NSSmGUI(QtWidgets.QMainWindow):
         # Show the dialog directly since it needs to be synchronous
         dialog = AddServiceDialog(self, existing_config=ServiceConfig())
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            config = dialog.get_service_config()
+            config = dialog.service_config
             if config:
                 # Show "loading" cursor
                 QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
@@ -468,7 +526,7 @@ class NSSmGUI(QtWidgets.QMainWindow):
         # Show the edit dialog
         dialog = AddServiceDialog(self, existing_config=config)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            updated_config = dialog.get_service_config()
+            updated_config = dialog.service_config
             if updated_config:
                 # Show "loading" cursor
                 QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
@@ -742,48 +800,13 @@ class NSSmGUI(QtWidgets.QMainWindow):
             )
             return
             
-        # Get stdout and stderr logs
-        self.async_helper.run(
-            self.service_manager.get_service_logs(service_name, 'stdout'),
-            lambda stdout_logs, exception: self.view_logs_get_stdout_callback(
-                stdout_logs, exception, service_name, config
-            )
-        )
-            
-    def view_logs_get_stdout_callback(self, stdout_logs, exception, service_name, config):
-        """Callback for get service stdout logs."""
-        if exception:
-            # Restore cursor
-            if QtWidgets.QApplication.overrideCursor():
-                QtWidgets.QApplication.restoreOverrideCursor()
-                
-            self.logger.error(f"Error getting stdout logs: {str(exception)}")
-            QtWidgets.QMessageBox.critical(
-                self, "Error", f"Failed to get stdout logs: {str(exception)}"
-            )
-            return
-            
-        # Now get stderr logs
-        self.async_helper.run(
-            self.service_manager.get_service_logs(service_name, 'stderr'),
-            lambda stderr_logs, exception: self.view_logs_get_stderr_callback(
-                stderr_logs, exception, service_name, config, stdout_logs
-            )
-        )
-            
-    def view_logs_get_stderr_callback(self, stderr_logs, exception, service_name, config, stdout_logs):
-        """Callback for get service stderr logs."""
         # Restore cursor
         if QtWidgets.QApplication.overrideCursor():
             QtWidgets.QApplication.restoreOverrideCursor()
             
-        if exception:
-            self.logger.error(f"Error getting stderr logs: {str(exception)}")
-            stderr_logs = f"Error getting stderr logs: {str(exception)}"
-            
-        # Show log viewer dialog
+        # Show log viewer dialog; it reads the log files itself
         dialog = LogViewerDialog(
-            self, service_name, stdout_logs, stderr_logs,
+            self, service_name,
             stdout_path=config.stdout_path, stderr_path=config.stderr_path
         )
         dialog.exec_()
@@ -792,7 +815,7 @@ class NSSmGUI(QtWidgets.QMainWindow):
         """Update the service details panel when a service is selected."""
         if selected.indexes():
             row = selected.indexes()[0].row()
-            service = self.table_model.get_service(row)
+            service = self.service_at_row(row)
             
             if service:
                 self.detail_name.setText(service.name)
@@ -838,7 +861,12 @@ class NSSmGUI(QtWidgets.QMainWindow):
             return None
             
         row = indexes[0].row()
-        return self.table_model.get_service(row)
+        return self.service_at_row(row)
+        
+    def service_at_row(self, row: int) -> Optional[ServiceInfo]:
+        """Get the service shown in a row of the (filtered, sorted) table."""
+        source_index = self.proxy_model.mapToSource(self.proxy_model.index(row, 0))
+        return self.table_model.get_service(source_index.row())
         
     def import_config(self):
         """Import service configuration(s)."""
@@ -960,7 +988,7 @@ class NSSmGUI(QtWidgets.QMainWindow):
         """Show the preferences dialog."""
         dialog = PreferencesDialog(self)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            self.save_preferences(dialog.get_preferences())
+            self.save_preferences(dialog.preferences)
             self.apply_preferences()
             
     def load_preferences(self):
@@ -1029,6 +1057,10 @@ class NSSmGUI(QtWidgets.QMainWindow):
         """Handle the close event."""
         # Stop the refresh timer
         self.refresh_timer.stop()
+        
+        # Kill the PowerShell session used for service queries; nothing
+        # would be left to wait for a graceful shutdown
+        self.service_manager.kill()
         event.accept()
         
     # Async methods
@@ -1047,15 +1079,9 @@ class NSSmGUI(QtWidgets.QMainWindow):
             # Update the model
             self.table_model.update_services(services)
             
-            # Update status label
+            # Update status label; the model update keeps the selection
             self.status_label.setText(f"Total services: {len(services)}")
             
-            # Retain selection if possible
-            if self.service_table.selectionModel().hasSelection():
-                selected_row = self.service_table.selectionModel().selectedRows()[0].row()
-                if selected_row < len(services):
-                    self.service_table.selectRow(selected_row)
-                    
             return True
         except Exception as e:
             self.logger.error(f"Error refreshing services: {str(e)}")
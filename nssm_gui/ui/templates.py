@@ -272,7 +272,7 @@ class TemplateManagerDialog(QtWidgets.QDialog):
         # Show dialog to edit the config
         dialog = AddServiceDialog(self, existing_config=config)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            config = dialog.get_service_config()
+            config = dialog.service_config
             if config:
                 # Ask for template name
                 name, ok = QtWidgets.QInputDialog.getText(
@@ -420,7 +420,7 @@ class TemplateManagerDialog(QtWidgets.QDialog):
             # Show dialog to edit the config
             dialog = AddServiceDialog(self, existing_config=config)
             if dialog.exec_() == QtWidgets.QDialog.Accepted:
-                config = dialog.get_service_config()
+                config = dialog.service_config
                 if config:
                     # Save the template
                     self.save_template_to_config(self.current_template, config.model_dump())
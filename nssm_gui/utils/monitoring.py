@@ -3,12 +3,22 @@ import time
 import psutil
 import logging
 import asyncio
+from collections import deque
 from typing import Dict, List, Optional, Tuple, Any
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 logger = logging.getLogger("nssm_gui.monitoring")
 
+def _max_workers() -> int:
+    """Size of the monitoring thread pool, overridable with NSSM_GUI_MAX_WORKERS."""
+    value = os.environ.get('NSSM_GUI_MAX_WORKERS', '4')
+    try:
+        return max(1, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring NSSM_GUI_MAX_WORKERS={value!r}; it must be a whole number")
+        return 4
+
 class ServiceMonitor:
     """
     Monitor system resource usage of services.
@@ -24,7 +34,15 @@ class ServiceMonitor:
         self.max_history = max_history
         self.service_data = {}  # Map of service name to monitoring data
         self.running = False
-        self.executor = ThreadPoolExecutor(max_workers=4)
+        self._executor = None
+        self._revision = 0  # Bumped for every new sample of any service
+        
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for process queries, created on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=_max_workers())
+        return self._executor
         
     def start_monitoring(self):
         """Start the monitoring process."""
@@ -53,17 +71,7 @@ class ServiceMonitor:
                 
             # Initialize service data if it doesn't exist
             if service_name not in self.service_data:
-                self.service_data[service_name] = {
-                    'cpu_percent': [],
-                    'memory_percent': [],
-                    'memory_mb': [],
-                    'io_read_mb': [],
-                    'io_write_mb': [],
-                    'timestamps': [],
-                    'uptime': 0,
-                    'start_time': None,
-                    'restarts': 0
-                }
+                self.service_data[service_name] = self._new_service_data()
                 
             # Get process information
             loop = asyncio.get_event_loop()
@@ -85,7 +93,11 @@ class ServiceMonitor:
             data['memory_mb'].append(stats['memory_mb'])
             data['io_read_mb'].append(stats['io_read_mb'])
             data['io_write_mb'].append(stats['io_write_mb'])
-            data['timestamps'].append(datetime.now())
+            data['timestamps_ms'].append(int(time.time() * 1000))  # Epoch milliseconds
+            
+            # Let consumers tell whether anything changed since they looked
+            self._revision += 1
+            data['revision'] = self._revision
             
             # Set start time if not already set
             if data['start_time'] is None and stats['start_time'] is not None:
@@ -95,20 +107,34 @@ class ServiceMonitor:
             if data['start_time'] is not None:
                 data['uptime'] = (datetime.now() - data['start_time']).total_seconds()
                 
-            # Limit history
-            if len(data['cpu_percent']) > self.max_history:
-                data['cpu_percent'] = data['cpu_percent'][-self.max_history:]
-                data['memory_percent'] = data['memory_percent'][-self.max_history:]
-                data['memory_mb'] = data['memory_mb'][-self.max_history:]
-                data['io_read_mb'] = data['io_read_mb'][-self.max_history:]
-                data['io_write_mb'] = data['io_write_mb'][-self.max_history:]
-                data['timestamps'] = data['timestamps'][-self.max_history:]
-                
             return True
         except Exception as e:
             logger.error(f"Error updating service data for {service_name}: {str(e)}")
             return False
             
+    def _new_service_data(self) -> Dict[str, Any]:
+        """
+        Create empty monitoring data for a service.
+        
+        The histories are bounded deques, so old samples drop off as new
+        ones are appended.
+        
+        Returns:
+            Dictionary of empty service monitoring data
+        """
+        return {
+            'cpu_percent': deque(maxlen=self.max_history),
+            'memory_percent': deque(maxlen=self.max_history),
+            'memory_mb': deque(maxlen=self.max_history),
+            'io_read_mb': deque(maxlen=self.max_history),
+            'io_write_mb': deque(maxlen=self.max_history),
+            'timestamps_ms': deque(maxlen=self.max_history),
+            'uptime': 0,
+            'start_time': None,
+            'restarts': 0,
+            'revision': 0
+        }
+        
     def _get_process_stats(self, pid: int) -> Optional[Dict[str, Any]]:
         """
         Get process statistics.
@@ -161,17 +187,7 @@ class ServiceMonitor:
             service_name: Name of the service
         """
         if service_name in self.service_data:
-            self.service_data[service_name] = {
-                'cpu_percent': [],
-                'memory_percent': [],
-                'memory_mb': [],
-                'io_read_mb': [],
-                'io_write_mb': [],
-                'timestamps': [],
-                'uptime': 0,
-                'start_time': None,
-                'restarts': 0
-            }
+            self.service_data[service_name] = self._new_service_data()
             
     def increment_restart_count(self, service_name: str):
         """
@@ -199,11 +215,12 @@ class ServiceMonitor:
 
         data = self.service_data[service_name]
         
-        # Calculate averages, using sensible defaults for empty lists
-        cpu_history = data['cpu_percent']
-        mem_history = data['memory_percent']
-        mem_mb_history = data['memory_mb']
+        # Copy the histories so callers get an indexable snapshot
+        cpu_history = list(data['cpu_percent'])
+        mem_history = list(data['memory_percent'])
+        mem_mb_history = list(data['memory_mb'])
         
+        # Calculate averages, using sensible defaults for empty lists
         cpu_avg = sum(cpu_history) / len(cpu_history) if cpu_history else 0
         mem_avg = sum(mem_history) / len(mem_history) if mem_history else 0
         mem_mb_avg = sum(mem_mb_history) / len(mem_mb_history) if mem_mb_history else 0
@@ -218,12 +235,13 @@ class ServiceMonitor:
             'cpu_history': cpu_history,
             'memory_history': mem_history,
             'memory_mb_history': mem_mb_history,
-            'io_read_history': data['io_read_mb'],
-            'io_write_history': data['io_write_mb'],
-            'timestamps': data['timestamps'],
+            'io_read_history': list(data['io_read_mb']),
+            'io_write_history': list(data['io_write_mb']),
+            'timestamps_ms': list(data['timestamps_ms']),
             'uptime': data['uptime'],
             'start_time': data['start_time'],
             'restarts': data['restarts'],
+            'revision': data['revision'],
             'cpu_avg': cpu_avg,
             'cpu_current': cpu_current,
             'memory_avg': mem_avg,
@@ -240,6 +258,7 @@ class ServiceMonitor:
             Dictionary of service name to monitoring data
         """
         result = {}
-        for service_name in self.service_data:
+        # Iterate over a copy, as this may run on a worker thread
+        for service_name in list(self.service_data):
             result[service_name] = self.get_service_stats(service_name)
         return result
\ No newline at end of file
@@ -216,7 +216,7 @@ class TestNSSmGUI:
             
             # Create a test config
             test_config = ServiceConfig(service_name="test_service")
-            mock_dialog.get_service_config.return_value = test_config
+            mock_dialog.service_config = test_config
             
             # Call add_service
             main_window.add_service()
@@ -260,27 +260,31 @@ class TestNSSmGUI:
         """Test applyFilter method."""
         # Set up the model with test services
         main_window.table_model.update_services(services)
+        proxy = main_window.proxy_model
+        
+        # Check that the table shows the persistent proxy
+        assert main_window.service_table.model() is proxy
+        assert proxy.sourceModel() is main_window.table_model
+        assert proxy.rowCount() == 2
+        
+        # Test text filter
+        main_window.filter_input.setText("SERVICE1")
+        main_window.apply_filter()
+        assert proxy.rowCount() == 1
+        assert main_window.service_at_row(0) is services[0]
+        
+        # Test status filter
+        main_window.filter_input.setText("")
+        main_window.status_filter_combo.setCurrentText("Stopped")
+        main_window.apply_filter()
+        assert proxy.rowCount() == 1
+        assert main_window.service_at_row(0) is services[1]
+        
+        # Test combined filters
+        main_window.filter_input.setText("service1")
+        main_window.apply_filter()
+        assert proxy.rowCount() == 0
         
-        # Mock QSortFilterProxyModel
-        with patch('PyQt5.QtCore.QSortFilterProxyModel') as mock_proxy_class:
-            # Set up the mock proxy
-            mock_proxy = MagicMock()
-            mock_proxy_class.return_value = mock_proxy
-            
-            # Test text filter
-            main_window.filter_input.setText("service1")
-            main_window.apply_filter()
-            
-            # Check that proxy was created and configured
-            mock_proxy_class.assert_called_once()
-            mock_proxy.setSourceModel.assert_called_once_with(main_window.table_model)
-            mock_proxy.setFilterCaseSensitivity.assert_called_once_with(Qt.CaseInsensitive)
-            mock_proxy.setFilterKeyColumn.assert_called_once_with(0)
-            mock_proxy.setFilterRegExp.assert_called_once_with("service1")
-            
-            # Check that proxy was set on the table
-            main_window.service_table.setModel.assert_called_once_with(mock_proxy)
-            
     def test_get_selected_service(self, main_window, services):
         """Test getSelectedService method."""
         # Set up the model with test services
@@ -1,12 +1,18 @@
+import os
 import pytest
 import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
+from collections import deque
 from datetime import datetime, timedelta
 
 import psutil
 
 from nssm_gui.utils.monitoring import ServiceMonitor
 
+def to_ms(dt):
+    """Convert a datetime to epoch milliseconds, as the monitor stores them."""
+    return int(dt.timestamp() * 1000)
+
 class TestServiceMonitor:
     """Test cases for the ServiceMonitor class."""
     
@@ -23,6 +29,16 @@ class TestServiceMonitor:
         assert monitor.running is False
         assert monitor.executor is not None
         
+    def test_executor_max_workers(self, monitor):
+        """Test that the thread pool size can be set from the environment."""
+        with patch.dict(os.environ, {'NSSM_GUI_MAX_WORKERS': '16'}):
+            assert monitor.executor._max_workers == 16
+            
+    def test_executor_max_workers_invalid(self):
+        """Test that an invalid thread pool size falls back to the default."""
+        with patch.dict(os.environ, {'NSSM_GUI_MAX_WORKERS': 'lots'}):
+            assert ServiceMonitor().executor._max_workers == 4
+        
     def test_start_monitoring(self, monitor):
         """Test startMonitoring method."""
         # Start monitoring
@@ -91,12 +107,12 @@ class TestServiceMonitor:
             
             # Check that data was recorded correctly
             service_data = monitor.service_data["test-service"]
-            assert service_data['cpu_percent'] == [10.5]
-            assert service_data['memory_percent'] == [5.2]
-            assert service_data['memory_mb'] == [128.5]
-            assert service_data['io_read_mb'] == [2.1]
-            assert service_data['io_write_mb'] == [1.3]
-            assert len(service_data['timestamps']) == 1
+            assert list(service_data['cpu_percent']) == [10.5]
+            assert list(service_data['memory_percent']) == [5.2]
+            assert list(service_data['memory_mb']) == [128.5]
+            assert list(service_data['io_read_mb']) == [2.1]
+            assert list(service_data['io_write_mb']) == [1.3]
+            assert len(service_data['timestamps_ms']) == 1
             assert service_data['uptime'] > 0
             assert service_data['start_time'] == process_stats['start_time']
             
@@ -115,10 +131,11 @@ class TestServiceMonitor:
             'memory_mb': [64.0],
             'io_read_mb': [1.0],
             'io_write_mb': [0.5],
-            'timestamps': [datetime.now() - timedelta(minutes=5)],  # Last update was 5 minutes ago
+            'timestamps_ms': [to_ms(datetime.now() - timedelta(minutes=5))],  # Last update was 5 minutes ago
             'uptime': 3600.0,  # 1 hour
             'start_time': start_time,
-            'restarts': 1
+            'restarts': 1,
+            'revision': 0
         }
         
         # Mock process stats
@@ -146,15 +163,16 @@ class TestServiceMonitor:
             
             # Check that data was updated correctly
             service_data = monitor.service_data["test-service"]
-            assert service_data['cpu_percent'] == [5.0, 10.5]
-            assert service_data['memory_percent'] == [2.5, 5.2]
-            assert service_data['memory_mb'] == [64.0, 128.5]
-            assert service_data['io_read_mb'] == [1.0, 2.1]
-            assert service_data['io_write_mb'] == [0.5, 1.3]
-            assert len(service_data['timestamps']) == 2
+            assert list(service_data['cpu_percent']) == [5.0, 10.5]
+            assert list(service_data['memory_percent']) == [2.5, 5.2]
+            assert list(service_data['memory_mb']) == [64.0, 128.5]
+            assert list(service_data['io_read_mb']) == [1.0, 2.1]
+            assert list(service_data['io_write_mb']) == [0.5, 1.3]
+            assert len(service_data['timestamps_ms']) == 2
             assert service_data['uptime'] > 3600.0  # Should be more than before
             assert service_data['start_time'] == start_time
             assert service_data['restarts'] == 1  # Should be unchanged
+            assert service_data['revision'] > 0  # Marks the new sample
             
     @pytest.mark.asyncio
     @patch('asyncio.get_event_loop')
@@ -168,19 +186,20 @@ class TestServiceMonitor:
         
         # Initialize service data with max_history items
         monitor.service_data["test-service"] = {
-            'cpu_percent': [1.0, 2.0, 3.0],
-            'memory_percent': [1.0, 2.0, 3.0],
-            'memory_mb': [1.0, 2.0, 3.0],
-            'io_read_mb': [1.0, 2.0, 3.0],
-            'io_write_mb': [1.0, 2.0, 3.0],
-            'timestamps': [
-                datetime.now() - timedelta(minutes=15),
-                datetime.now() - timedelta(minutes=10),
-                datetime.now() - timedelta(minutes=5)
-            ],
+            'cpu_percent': deque([1.0, 2.0, 3.0], maxlen=3),
+            'memory_percent': deque([1.0, 2.0, 3.0], maxlen=3),
+            'memory_mb': deque([1.0, 2.0, 3.0], maxlen=3),
+            'io_read_mb': deque([1.0, 2.0, 3.0], maxlen=3),
+            'io_write_mb': deque([1.0, 2.0, 3.0], maxlen=3),
+            'timestamps_ms': deque([
+                to_ms(datetime.now() - timedelta(minutes=15)),
+                to_ms(datetime.now() - timedelta(minutes=10)),
+                to_ms(datetime.now() - timedelta(minutes=5))
+            ], maxlen=3),
             'uptime': 0.0,
             'start_time': None,
-            'restarts': 0
+            'restarts': 0,
+            'revision': 0
         }
         
         # Mock process stats
@@ -208,12 +227,12 @@ class TestServiceMonitor:
             
             # Check that history was limited to max_history
             service_data = monitor.service_data["test-service"]
-            assert service_data['cpu_percent'] == [2.0, 3.0, 4.0]  # First item should be removed
-            assert service_data['memory_percent'] == [2.0, 3.0, 4.0]
-            assert service_data['memory_mb'] == [2.0, 3.0, 4.0]
-            assert service_data['io_read_mb'] == [2.0, 3.0, 4.0]
-            assert service_data['io_write_mb'] == [2.0, 3.0, 4.0]
-            assert len(service_data['timestamps']) == 3
+            assert list(service_data['cpu_percent']) == [2.0, 3.0, 4.0]  # First item should be removed
+            assert list(service_data['memory_percent']) == [2.0, 3.0, 4.0]
+            assert list(service_data['memory_mb']) == [2.0, 3.0, 4.0]
+            assert list(service_data['io_read_mb']) == [2.0, 3.0, 4.0]
+            assert list(service_data['io_write_mb']) == [2.0, 3.0, 4.0]
+            assert len(service_data['timestamps_ms']) == 3
             
     @patch('psutil.Process')
     def test_get_process_stats(self, mock_process_class, monitor):
@@ -275,10 +294,11 @@ class TestServiceMonitor:
             'memory_mb': [128.5],
             'io_read_mb': [2.1],
             'io_write_mb': [1.3],
-            'timestamps': [datetime.now()],
+            'timestamps_ms': [to_ms(datetime.now())],
             'uptime': 3600.0,
             'start_time': datetime.now(),
-            'restarts': 2
+            'restarts': 2,
+            'revision': 0
         }
         
         # Call resetServiceData
@@ -286,12 +306,12 @@ class TestServiceMonitor:
         
         # Check that data was reset
         service_data = monitor.service_data["test-service"]
-        assert service_data['cpu_percent'] == []
-        assert service_data['memory_percent'] == []
-        assert service_data['memory_mb'] == []
-        assert service_data['io_read_mb'] == []
-        assert service_data['io_write_mb'] == []
-        assert service_data['timestamps'] == []
+        assert list(service_data['cpu_percent']) == []
+        assert list(service_data['memory_percent']) == []
+        assert list(service_data['memory_mb']) == []
+        assert list(service_data['io_read_mb']) == []
+        assert list(service_data['io_write_mb']) == []
+        assert list(service_data['timestamps_ms']) == []
         assert service_data['uptime'] == 0
         assert service_data['start_time'] is None
         assert service_data['restarts'] == 0
@@ -305,10 +325,11 @@ class TestServiceMonitor:
             'memory_mb': [],
             'io_read_mb': [],
             'io_write_mb': [],
-            'timestamps': [],
+            'timestamps_ms': [],
             'uptime': 0,
             'start_time': None,
-            'restarts': 2
+            'restarts': 2,
+            'revision': 0
         }
         
         # Call incrementRestartCount
@@ -328,14 +349,15 @@ class TestServiceMonitor:
             'memory_mb': [64.0, 128.0, 192.0],
             'io_read_mb': [1.0, 2.0, 3.0],
             'io_write_mb': [0.5, 1.0, 1.5],
-            'timestamps': [
-                now - timedelta(minutes=15),
-                now - timedelta(minutes=10),
-                now - timedelta(minutes=5)
+            'timestamps_ms': [
+                to_ms(now - timedelta(minutes=15)),
+                to_ms(now - timedelta(minutes=10)),
+                to_ms(now - timedelta(minutes=5))
             ],
             'uptime': 3600.0,
             'start_time': start_time,
-            'restarts': 2
+            'restarts': 2,
+            'revision': 0
         }
         
         # Call getServiceStats
@@ -347,7 +369,7 @@ class TestServiceMonitor:
         assert stats['memory_mb_history'] == [64.0, 128.0, 192.0]
         assert stats['io_read_history'] == [1.0, 2.0, 3.0]
         assert stats['io_write_history'] == [0.5, 1.0, 1.5]
-        assert stats['timestamps'] == monitor.service_data["test-service"]['timestamps']
+        assert stats['timestamps_ms'] == monitor.service_data["test-service"]['timestamps_ms']
         assert stats['uptime'] == 3600.0
         assert stats['start_time'] == start_time
         assert stats['restarts'] == 2
@@ -383,10 +405,11 @@ class TestServiceMonitor:
             'memory_mb': [128.0],
             'io_read_mb': [2.0],
             'io_write_mb': [1.0],
-            'timestamps': [datetime.now()],
+            'timestamps_ms': [to_ms(datetime.now())],
             'uptime': 3600.0,
             'start_time': datetime.now() - timedelta(hours=1),
-            'restarts': 1
+            'restarts': 1,
+            'revision': 0
         }
         
         monitor.service_data["service2"] = {
@@ -395,10 +418,11 @@ class TestServiceMonitor:
             'memory_mb': [256.0],
             'io_read_mb': [4.0],
             'io_write_mb': [2.0],
-            'timestamps': [datetime.now()],
+            'timestamps_ms': [to_ms(datetime.now())],
             'uptime': 7200.0,
             'start_time': datetime.now() - timedelta(hours=2),
-            'restarts': 0
+            'restarts': 0,
+            'revision': 0
         }
         
         # Call getAllServiceStats
@@ -1,4 +1,5 @@
 import pytest
+import os
 import json
 import subprocess
 import asyncio
@@ -15,14 +16,11 @@ class TestNSSmManager:
         return NSSmManager("C:\\path\\to\\nssm.exe")
 
     @pytest.mark.asyncio
-    @patch("asyncio.get_event_loop")
-    @patch("asyncio.new_event_loop")
-    @patch("subprocess.run")
-    async def test_get_services(self, mock_run, mock_new_loop, mock_get_loop, service_manager):
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_services(self, mock_create, service_manager):
         """Test getting services."""
-        # Mock subprocess.run to return services data
-        mock_process = MagicMock()
-        mock_process.stdout = json.dumps([
+        # Mock the PowerShell session to return services data
+        services_json = json.dumps([
             {
                 "Name": "TestService1",
                 "DisplayName": "Test Service 1",
@@ -39,15 +37,14 @@ class TestNSSmManager:
                 "ProcessId": None,
                 "PathName": "C:\\path\\to\\nssm.exe"
             }
-        ])
-        mock_process.returncode = 0
-        mock_run.return_value = mock_process
-
-        # Mock the event loop
-        mock_loop = MagicMock()
-        mock_loop.run_in_executor = AsyncMock(return_value=mock_process)
-        mock_get_loop.return_value = mock_loop
-        mock_new_loop.return_value = mock_loop
+        ]).encode('utf-8')
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.readuntil = AsyncMock(
+            return_value=services_json + b"\r\n---NSSM-GUI-END---"
+        )
+        mock_create.return_value = mock_process
 
         # Call the function
         services = await service_manager.get_services()
@@ -64,27 +61,86 @@ class TestNSSmManager:
         assert services[1].state == "Stopped"
         assert services[1].pid is None
 
+        # The PowerShell session is reused for later calls
+        await service_manager.get_services()
+        mock_create.assert_called_once()
+        assert mock_process.stdin.write.call_count == 2
+
     @pytest.mark.asyncio
-    @patch("subprocess.run")
-    async def test_run_nssm_command(self, mock_run, service_manager):
+    @patch("asyncio.create_subprocess_exec")
+    async def test_get_services_powershell_error(self, mock_create, service_manager):
+        """Test that PowerShell errors are reported instead of parsed as JSON."""
+        # Mock the PowerShell session to report an error before the sentinel
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.readuntil = AsyncMock(
+            return_value=b"---NSSM-GUI-ERROR---Get-CimInstance : Access denied\r\n---NSSM-GUI-END---"
+        )
+        mock_create.return_value = mock_process
+
+        # The error text is raised, not a JSON parse failure
+        with pytest.raises(RuntimeError, match="Failed to get services: Get-CimInstance : Access denied"):
+            await service_manager.get_services()
+
+        # stderr is kept off the output stream, and the session stays usable
+        assert mock_create.call_args.kwargs['stderr'] == asyncio.subprocess.DEVNULL
+        mock_process.kill.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("asyncio.create_subprocess_exec")
+    async def test_close_waits_for_running_script(self, mock_create, service_manager):
+        """Test that closing the PowerShell session waits for a running script."""
+        release = asyncio.Event()
+
+        async def readuntil(separator):
+            await release.wait()
+            return b"[]" + separator
+
+        mock_process = MagicMock()
+        mock_process.returncode = None
+        mock_process.stdin.drain = AsyncMock()
+        mock_process.stdout.readuntil = readuntil
+        mock_process.wait = AsyncMock()
+        mock_create.return_value = mock_process
+
+        query = asyncio.ensure_future(service_manager.get_services())
+        await asyncio.sleep(0)
+        closing = asyncio.ensure_future(service_manager.close())
+        await asyncio.sleep(0)
+
+        # The session stays open until the script has finished
+        mock_process.stdin.close.assert_not_called()
+        release.set()
+        assert await query == []
+        await closing
+        mock_process.stdin.close.assert_called_once()
+        mock_process.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_nssm_command(self, mock_create, service_manager):
         """Test running NSSM commands."""
-        # Mock subprocess.run to return success
+        # Mock the NSSM process to return success
         mock_process = MagicMock()
-        mock_process.stdout = b"Command succeeded"
-        mock_process.stderr = b""
+        mock_process.communicate = AsyncMock(return_value=(b"Command succeeded", b""))
         mock_process.returncode = 0
-        mock_run.return_value = mock_process
+        mock_create.return_value = mock_process
 
         # Call the function
         result = await service_manager.run_nssm_command(["test", "command"])
 
         # Check results
         assert "Command succeeded" in result
-        mock_run.assert_called_once()
-        args, kwargs = mock_run.call_args
-        assert args[0][0] == "C:\\path\\to\\nssm.exe"
-        assert args[0][1] == "test"
-        assert args[0][2] == "command"
+        mock_create.assert_called_once()
+        args, kwargs = mock_create.call_args
+        assert args[0] == "C:\\path\\to\\nssm.exe"
+        assert args[1] == "test"
+        assert args[2] == "command"
+
+        # Raw output is returned when decoding is not wanted
+        result = await service_manager.run_nssm_command(["test", "command"], decode=False)
+        assert result == b"Command succeeded"
 
     @pytest.mark.asyncio
     @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
@@ -115,10 +171,95 @@ class TestNSSmManager:
 
     @pytest.mark.asyncio
     @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
-    async def test_configure_service_new(self, mock_run_command, service_manager):
+    async def test_get_service_config_cached(self, mock_run_command, service_manager):
+        """Test that an unchanged dump is not parsed again."""
+        mock_run_command.return_value = 'nssm.exe set TestService DisplayName "Test Service"\n'
+
+        with patch.object(service_manager, "_parse_nssm_dump",
+                          wraps=service_manager._parse_nssm_dump) as mock_parse:
+            first = await service_manager.get_service_config("TestService")
+            second = await service_manager.get_service_config("TestService")
+            assert first == second
+            assert mock_parse.call_count == 1
+
+            # Callers get their own copy of the cached configuration
+            assert first is not second
+            first.dependencies.append("Tcpip")
+            fourth = await service_manager.get_service_config("TestService")
+            assert fourth.dependencies == []
+
+            # A changed dump is parsed again
+            mock_run_command.return_value = 'nssm.exe set TestService DisplayName "Renamed"\n'
+            third = await service_manager.get_service_config("TestService")
+            assert third.display_name == "Renamed"
+            assert mock_parse.call_count == 2
+
+    def test_parse_nssm_dump_quoting(self, service_manager):
+        """Test tokenizing quoted NSSM dump output."""
+        output = (
+            '"C:\\path to\\nssm.exe" install TestService "C:\\Program Files\\app.exe"\n'
+            '"C:\\path to\\nssm.exe" set TestService DisplayName "Test Service"\n'
+            '"C:\\path to\\nssm.exe" set TestService AppExit Default Exit\n'
+        )
+
+        config = service_manager._parse_nssm_dump(output)
+
+        assert config['service_name'] == 'TestService'
+        assert config['application_path'] == 'C:\\Program Files\\app.exe'
+        assert config['display_name'] == 'Test Service'
+        assert config['app_exit'] == 'Exit'
+
+    def test_parse_nssm_dump_environment(self, service_manager):
+        """Test parsing environment variables from NSSM dump output."""
+        output = (
+            'nssm.exe set TestService AppEnvironmentExtra "PATH=C:\\bin;C:\\tools"\n'
+            'nssm.exe set TestService AppEnvironmentExtra "OPTS=-Dkey=value"\n'
+            'nssm.exe set TestService AppEnvironmentExtra "INVALID"\n'
+        )
+
+        config = service_manager._parse_nssm_dump(output)
+
+        assert config['env_variables'] == {
+            'PATH': 'C:\\bin;C:\\tools',
+            'OPTS': '-Dkey=value'
+        }
+
+    def test_parse_nssm_dump_collections(self, service_manager):
+        """Test parsing dependencies and hooks from NSSM dump output."""
+        output = (
+            'nssm.exe set TestService DependOnService Tcpip\n'
+            'nssm.exe set TestService DependOnService Dnscache\n'
+            'nssm.exe set TestService Hook_Start_Pre "C:\\hooks\\pre.bat"\n'
+            'nssm.exe set TestService HookShareOutputHandles 1\n'
+        )
+
+        config = service_manager._parse_nssm_dump(output)
+
+        assert config['dependencies'] == ['Tcpip', 'Dnscache']
+        assert config['hooks'] == {'Start_Pre': 'C:\\hooks\\pre.bat'}
+        assert config['hook_share_output_handles'] is True
+        assert 'env_variables' not in config
+
+    def test_parse_nssm_dump_numbers(self, service_manager):
+        """Test parsing numeric settings from NSSM dump output."""
+        output = (
+            'nssm.exe set TestService KillConsoleDelay 1500\n'
+            'nssm.exe set TestService RestartDelay -1\n'
+            'nssm.exe set TestService ThrottleDelay abc\n'
+        )
+
+        config = service_manager._parse_nssm_dump(output)
+
+        assert config['kill_console_delay'] == 1500
+        assert config['restart_delay'] == -1
+        assert 'throttle_delay' not in config
+
+    @pytest.mark.asyncio
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_batch")
+    async def test_configure_service_new(self, mock_run_batch, service_manager):
         """Test configuring a new service."""
-        # Mock run_nssm_command to return success
-        mock_run_command.return_value = "Success"
+        # Mock run_nssm_batch to return success
+        mock_run_batch.return_value = None
 
         # Create a test config
         config = ServiceConfig(
@@ -135,20 +276,22 @@ class TestNSSmManager:
 
         # Check results
         assert result is True
-        assert mock_run_command.call_count > 0
+        mock_run_batch.assert_called_once()
+        commands = mock_run_batch.call_args[0][0]
+        assert len(commands) > 1
         
-        # Check that install command was called
-        install_call = mock_run_command.call_args_list[0]
-        assert install_call[0][0][0] == "install"
-        assert install_call[0][0][1] == "TestService"
-        assert install_call[0][0][2] == "C:\\app\\test.exe"
+        # Check that install command comes first
+        install_call = commands[0]
+        assert install_call[0] == "install"
+        assert install_call[1] == "TestService"
+        assert install_call[2] == "C:\\app\\test.exe"
 
     @pytest.mark.asyncio
-    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
-    async def test_configure_service_edit(self, mock_run_command, service_manager):
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_batch")
+    async def test_configure_service_edit(self, mock_run_batch, service_manager):
         """Test editing an existing service."""
-        # Mock run_nssm_command to return success
-        mock_run_command.return_value = "Success"
+        # Mock run_nssm_batch to return success
+        mock_run_batch.return_value = None
 
         # Create a test config
         config = ServiceConfig(
@@ -163,12 +306,11 @@ class TestNSSmManager:
 
         # Check results
         assert result is True
-        assert mock_run_command.call_count > 0
+        mock_run_batch.assert_called_once()
         
         # Check that application was updated
         app_call_found = False
-        for call in mock_run_command.call_args_list:
-            args = call[0][0]
+        for args in mock_run_batch.call_args[0][0]:
             if len(args) >= 4 and args[0] == "set" and args[1] == "TestService" and args[2] == "Application":
                 app_call_found = True
                 assert args[3] == "C:\\app\\new.exe"
@@ -176,6 +318,129 @@ class TestNSSmManager:
                 
         assert app_call_found, "Application update call not found"
         
+    @pytest.mark.asyncio
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_nssm_batch(self, mock_run, service_manager):
+        """Test running several NSSM commands from one batch file."""
+        scripts = []
+
+        async def run_batch(*args, **kwargs):
+            with open(args[-1], newline='') as f:
+                scripts.append(f.read())
+            return mock_process
+
+        mock_process = MagicMock()
+        mock_process.communicate = AsyncMock(return_value=(b"", b""))
+        mock_process.returncode = 0
+        mock_run.side_effect = run_batch
+
+        await service_manager.run_nssm_batch([
+            ["set", "TestService", "DisplayName", "Test Service"],
+            ["set", "TestService", "AppDirectory", "C:\\app dir\\"],
+            ["set", "TestService", "AppEnvironmentExtra", "PATH=%PATH%;C:\\bin"],
+        ])
+
+        mock_run.assert_called_once()
+        args, kwargs = mock_run.call_args
+        assert args[:3] == ("cmd.exe", "/d", "/c")
+        assert not os.path.isfile(args[3])
+        assert scripts == [
+            '@echo off\r\n'
+            'C:\\path\\to\\nssm.exe set TestService DisplayName "Test Service" || exit /b 1\r\n'
+            'C:\\path\\to\\nssm.exe set TestService AppDirectory "C:\\app dir\\\\" || exit /b 1\r\n'
+            'C:\\path\\to\\nssm.exe set TestService AppEnvironmentExtra "PATH=%%PATH%%;C:\\bin" || exit /b 1\r\n'
+        ]
+
+    @pytest.mark.asyncio
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_nssm_batch_fallback(self, mock_run, mock_run_command, service_manager):
+        """Test that unquotable arguments run one command per process."""
+        commands = [
+            ["set", "TestService", "DisplayName", "Test Service"],
+            ["set", "TestService", "Description", 'Runs "test.exe"'],
+        ]
+
+        await service_manager.run_nssm_batch(commands)
+
+        mock_run.assert_not_called()
+        assert [call[0][0] for call in mock_run_command.call_args_list] == commands
+
+    def test_build_config_commands_skip_defaults(self, service_manager):
+        """Test leaving out settings a new install already has."""
+        config = ServiceConfig(
+            service_name="TestService",
+            start="SERVICE_DEMAND_START"
+        )
+
+        settings = [cmd[2] for cmd in service_manager._build_config_commands(
+            "TestService", config, skip_defaults=True
+        )]
+        assert "Start" in settings
+        assert "AppExit" not in settings
+        assert "RotateFiles" not in settings
+        # NSSM's own defaults differ for these, so they are always set
+        assert "KillConsoleDelay" in settings
+        assert "KillProcessTree" in settings
+
+        settings = [cmd[2] for cmd in service_manager._build_config_commands("TestService", config)]
+        assert "AppExit" in settings
+        assert "RotateFiles" in settings
+
+    @pytest.mark.asyncio
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_batch")
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
+    async def test_configure_service_unbatchable(self, mock_run_command, mock_run_batch, service_manager):
+        """Test configuring a service whose settings cannot be batched."""
+        mock_run_command.return_value = "Success"
+
+        config = ServiceConfig(
+            service_name="TestService",
+            application_path="C:\\app\\test.exe",
+            dependencies=["Tcpip", "Dnscache"],
+            description='Runs "test.exe"'
+        )
+
+        result = await service_manager.configure_service(config, edit=False)
+
+        assert result is True
+        mock_run_batch.assert_not_called()
+        commands = [call[0][0] for call in mock_run_command.call_args_list]
+        assert commands[0] == ["install", "TestService", "C:\\app\\test.exe"]
+        assert ["set", "TestService", "Description", 'Runs "test.exe"'] in commands
+
+        # Dependencies are still added in order
+        dependencies = [cmd[4] for cmd in commands if cmd[2] == "DependOnService"]
+        assert dependencies == ["Tcpip", "Dnscache"]
+
+    @pytest.mark.asyncio
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
+    async def test_configure_service_unbatchable_account_order(self, mock_run_command, service_manager):
+        """Test that the account is set before the service type when not batched."""
+        finished = []
+
+        async def run_command(args, decode=True):
+            # A slow ObjectName would let a concurrent Type finish first
+            if args[2] == "ObjectName":
+                await asyncio.sleep(0.01)
+            finished.append(args[2])
+            return "Success"
+
+        mock_run_command.side_effect = run_command
+
+        config = ServiceConfig(
+            service_name="TestService",
+            application_path="C:\\app\\test.exe",
+            object_name="DOMAIN\\User",
+            type="SERVICE_INTERACTIVE_PROCESS",
+            description='Runs "test.exe"'
+        )
+
+        result = await service_manager.configure_service(config, edit=True)
+
+        assert result is True
+        assert finished.index("ObjectName") < finished.index("Type")
+
     @pytest.mark.asyncio
     @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
     async def test_remove_service(self, mock_run_command, service_manager):
@@ -274,4 +539,22 @@ class TestNSSmManager:
         args, kwargs = mock_run.call_args
         assert args[0][0] == "sc"
         assert args[0][1] == "query"
-        assert args[0][2] == "TestService"
\ No newline at end of file
+        assert args[0][2] == "TestService"
+
+    @pytest.mark.asyncio
+    @patch("nssm_gui.service_manager.NSSmManager.run_nssm_command")
+    async def test_get_service_logs_tail(self, mock_run_command, service_manager, tmp_path):
+        """Test that only the end of a large log file is returned."""
+        log_file = tmp_path / "service.log"
+        log_file.write_text("".join(f"line {i}\n" for i in range(1000)))
+        mock_run_command.return_value = f"{log_file}\r\n"
+
+        tail = await service_manager.get_service_logs("TestService", max_bytes=100)
+        assert tail.endswith("line 999\n")
+        assert tail.startswith("line ")
+        assert len(tail) <= 100
+
+        full = await service_manager.get_service_logs("TestService", max_bytes=None)
+        assert full.startswith("line 0\n")
+        assert full.endswith("line 999\n")
+        mock_run_command.assert_called_with(["get", "TestService", "AppStdout"])